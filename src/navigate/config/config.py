@@ -32,6 +32,7 @@
 # Standard Library Imports
 import os
 import sys
+import json
 import time
 import shutil
 import platform
@@ -45,6 +46,7 @@ import yaml
 
 # Local Imports
 from navigate.tools.common_functions import build_ref_name
+from navigate.tools.file_functions import YAML_LOADER
 
 # Logger Setup
 p = __name__.split(".")[1]
@@ -146,12 +148,17 @@ def load_configs(manager, **kwargs):
         file_path = Path(file_path)
         assert file_path.exists(), "Configuration File not found: {}".format(file_path)
         with open(file_path) as f:
+            content = f.read()
+        try:
             try:
-                config_data = yaml.load(f, Loader=yaml.FullLoader)
-                build_nested_dict(manager, config_dict, config_name, config_data)
-            except yaml.YAMLError as yaml_error:
-                print(f"Configuration - Yaml Error: {yaml_error}")
-                sys.exit(1)
+                # files saved by navigate are JSON, which parses far faster than YAML
+                config_data = json.loads(content)
+            except (TypeError, ValueError):
+                config_data = yaml.load(content, Loader=YAML_LOADER)
+            build_nested_dict(manager, config_dict, config_name, config_data)
+        except yaml.YAMLError as yaml_error:
+            print(f"Configuration - Yaml Error: {yaml_error}")
+            sys.exit(1)
 
     # return combined dictionary
     return config_dict
@@ -212,7 +219,7 @@ def update_config_dict(manager, parent_dict, config_name, new_config) -> bool:
             file_path.endswith(".yml") or file_path.endswith(".yaml")
         ):
             with open(file_path) as f:
-                new_config = yaml.load(f, Loader=yaml.FullLoader)
+                new_config = yaml.load(f, Loader=YAML_LOADER)
         else:
             return False
 
@@ -639,12 +639,17 @@ class Controller:
 
             Parameters
             __________
-            args[0] : dict
+            args[0] : dict or float
                 dict = {'x': value, 'y': value, 'z': value, 'theta': value, 'f': value}
+                or the position of a single axis
+            args[1] : str, optional
+                axis name when args[0] is a single position
             """
-            self.threads_pool.createThread(
-                "model", self.move_stage, args=({args[1] + "_abs": args[0]},)
-            )
+            if isinstance(args[0], dict):
+                pos_dict = {f"{axis}_abs": value for axis, value in args[0].items()}
+            else:
+                pos_dict = {args[1] + "_abs": args[0]}
+            self.threads_pool.createThread("model", self.move_stage, args=(pos_dict,))
 
         elif command == "stop_stage":
             """Creates a thread and uses it to call the model to stop stage"""
@@ -943,7 +948,7 @@ class Controller:
                 filename="experiment.yml",
             )
             if hasattr(self, "waveform_popup_controller"):
-                self.waveform_popup_controller.save_waveform_constants()
+                self.waveform_popup_controller.save_waveform_constants(blocking=True)
 
             self.model.run_command("terminate")
             self.model = None
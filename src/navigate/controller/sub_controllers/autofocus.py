@@ -101,6 +101,7 @@ class AutofocusPopupController(GUIController):
         self.setting_dict = self.parent_controller.configuration["experiment"][
             "AutoFocusParameters"
         ]
+        self.update_plot_steps()
         #: str: The microscope name.
         self.microscope_name = self.parent_controller.configuration["experiment"][
             "MicroscopeState"
@@ -108,23 +109,22 @@ class AutofocusPopupController(GUIController):
         setting_dict = self.setting_dict[self.microscope_name]
 
         # Default to stages, if they exist.
-        if "stage" in setting_dict:
-            device = "stage"
-        else:
-            device = setting_dict.keys()[0]
-        self.widgets["device"].widget["values"] = setting_dict.keys()
+        devices = tuple(setting_dict.keys())
+        device = "stage" if "stage" in devices else devices[0]
+        self.widgets["device"].widget["values"] = devices
         self.widgets["device"].set(device)
 
         # Default to the f axis, if it exists.
-        if "f" in setting_dict[device]:
-            device_ref = "f"
-        else:
-            device_ref = setting_dict[device].keys()[0]
-        self.widgets["device_ref"].widget["values"] = setting_dict[device].keys()
+        device_setting_dict = setting_dict[device]
+        device_refs = tuple(device_setting_dict.keys())
+        device_ref = "f" if "f" in device_refs else device_refs[0]
+        self.widgets["device_ref"].widget["values"] = device_refs
         self.widgets["device_ref"].set(device_ref)
 
+        #: dict: The settings of the selected device and reference.
+        self.device_ref_setting_dict = device_setting_dict[device_ref]
         for k in self.view.setting_vars:
-            self.view.setting_vars[k].set(setting_dict[device][device_ref][k])
+            self.view.setting_vars[k].set(self.device_ref_setting_dict[k])
 
     def showup(self):
         """Shows the popup window"""
@@ -142,17 +142,21 @@ class AutofocusPopupController(GUIController):
             "autofocus_device_ref"
         ] = device_ref
         # verify autofocus parameters
-        setting_dict = self.setting_dict[self.microscope_name][device][device_ref]
+        # copy the shared settings once rather than fetching each value separately
+        setting_dict = self.setting_dict[self.microscope_name][device][
+            device_ref
+        ].copy()
         warning_message = ""
-        for k in ["coarse", "fine"]:
-            if setting_dict[f"{k}_selected"]:
-                try:
-                    step = float(setting_dict[f"{k}_step_size"])
-                    value = float(setting_dict[f"{k}_range"])
-                    if step <= 0 or value < step:
-                        warning_message += f"{k} settings are not correct!\n"
-                except Exception:
-                    warning_message += f"{k} settings are not correct!\n"
+        for k in ("coarse", "fine"):
+            if not setting_dict[f"{k}_selected"]:
+                continue
+            try:
+                step = float(setting_dict[f"{k}_step_size"])
+                value = float(setting_dict[f"{k}_range"])
+            except Exception:
+                step = value = 0
+            if step <= 0 or value < step:
+                warning_message += f"{k} settings are not correct!\n"
         if warning_message:
             messagebox.showerror(
                 title="Navigate",
@@ -169,7 +173,7 @@ class AutofocusPopupController(GUIController):
         args: tk event arguments
         """
         device = self.widgets["device"].widget.get()
-        device_refs = self.setting_dict[self.microscope_name][device].keys()
+        device_refs = tuple(self.setting_dict[self.microscope_name][device].keys())
         self.widgets["device_ref"].widget["values"] = device_refs
         self.widgets["device_ref"].widget.set(device_refs[0])
 
@@ -182,9 +186,11 @@ class AutofocusPopupController(GUIController):
         """
         device = self.widgets["device"].widget.get()
         device_ref = self.widgets["device_ref"].widget.get()
-        setting_dict = self.setting_dict[self.microscope_name]
+        self.device_ref_setting_dict = self.setting_dict[self.microscope_name][device][
+            device_ref
+        ]
         for k in self.view.setting_vars:
-            self.view.setting_vars[k].set(setting_dict[device][device_ref][k])
+            self.view.setting_vars[k].set(self.device_ref_setting_dict[k])
 
     def update_setting_dict(self, parameter):
         """Show Autofocus Parameters
@@ -196,14 +202,24 @@ class AutofocusPopupController(GUIController):
         """
 
         def func(*args):
-            device = self.widgets["device"].widget.get()
-            device_ref = self.widgets["device_ref"].widget.get()
-            self.setting_dict[self.microscope_name][device][device_ref][
+            self.device_ref_setting_dict[parameter] = self.view.setting_vars[
                 parameter
-            ] = self.view.setting_vars[parameter].get()
+            ].get()
 
         return func
 
+    def update_plot_steps(self):
+        """Calculate the coarse and fine portions of the autofocus plot data."""
+        coarse_range = self.setting_dict.get("coarse_range", 500)
+        coarse_step = self.setting_dict.get("coarse_step_size", 50)
+        fine_range = self.setting_dict.get("fine_range", 50)
+        fine_step = self.setting_dict.get("fine_step_size", 5)
+
+        #: int: Number of coarse steps in the autofocus plot data.
+        self.coarse_steps = int(coarse_range) // int(coarse_step) + 1
+        #: int: Number of fine steps in the autofocus plot data.
+        self.fine_steps = int(fine_range) // int(fine_step) + 1
+
     def display_plot(self, data_and_flags):
         """Displays the autofocus plot
 
@@ -219,14 +235,9 @@ class AutofocusPopupController(GUIController):
         """
         data, line_plot, clear_data = data_and_flags
         data = np.asarray(data)
-        coarse_range = self.setting_dict.get("coarse_range", 500)
-        coarse_step = self.setting_dict.get("coarse_step_size", 50)
-        fine_range = self.setting_dict.get("fine_range", 50)
-        fine_step = self.setting_dict.get("fine_step_size", 5)
-
-        # Calculate the coarse portion of the data
-        coarse_steps = int(coarse_range) // int(coarse_step) + 1
-        fine_steps = int(fine_range) // int(fine_step) + 1
+        x = np.ascontiguousarray(data[:, 0])
+        y = np.ascontiguousarray(data[:, 1])
+        coarse_steps, fine_steps = self.coarse_steps, self.fine_steps
 
         if line_plot is True:
             marker = "r-"
@@ -236,40 +247,41 @@ class AutofocusPopupController(GUIController):
         if clear_data is True:
             self.autofocus_coarse.clear()
 
-        # Plotting coarse data
-        self.coarse_plot = self.autofocus_coarse.plot(
-            data[:coarse_steps, 0], data[:coarse_steps, 1], marker
-        )
-
-        # Plotting fine data
+        # Plotting coarse and fine data as one line, broken by a NaN point
         self.coarse_plot = self.autofocus_coarse.plot(
-            data[fine_steps:, 0], data[fine_steps:, 1], marker
+            np.concatenate((x[:coarse_steps], [np.nan], x[fine_steps:])),
+            np.concatenate((y[:coarse_steps], [np.nan], y[fine_steps:])),
+            marker,
         )
 
         # Plot the maxima
-        y_max = np.max(data[:, 1])
-        peak_loc = data[np.argmax(data[:, 1]), 0]
-
-        y_axes_limit = self.autofocus_coarse.get_ylim()
-        x_axes_limit = self.autofocus_coarse.get_xlim()
+        peak_index = int(np.argmax(y))
+        y_max = y[peak_index]
+        peak_loc = x[peak_index]
 
         # Vertical Indicator
-        self.coarse_plot = self.autofocus_coarse.plot(
-            [peak_loc, peak_loc], [y_axes_limit[0], y_axes_limit[1]], "--", color="gray"
+        self.coarse_plot = self.autofocus_coarse.axvline(
+            peak_loc, linestyle="--", color="gray"
         )
 
         # Horizontal Indicator
-        self.coarse_plot = self.autofocus_coarse.plot(
-            [x_axes_limit[0], x_axes_limit[1]], [y_max, y_max], "--", color="gray"
+        self.coarse_plot = self.autofocus_coarse.axhline(
+            y_max, linestyle="--", color="gray"
         )
 
+        # Clearing the axes drops its labels and formatting, so only then do they
+        # need to be restored and the figure layout solved again.
+        if clear_data is True:
+            self.autofocus_coarse.set_title("Discrete Cosine Transform", fontsize=18)
+            self.autofocus_coarse.set_xlabel("Focus Stage Position", fontsize=16)
+            self.autofocus_coarse.ticklabel_format(
+                style="sci", axis="y", scilimits=(0, 0)
+            )
+            self.autofocus_coarse.yaxis.set_minor_locator(tck.AutoMinorLocator())
+            self.autofocus_coarse.xaxis.set_minor_locator(tck.AutoMinorLocator())
+            self.autofocus_fig.tight_layout()
+
         # To redraw the plot
-        self.autofocus_coarse.set_title("Discrete Cosine Transform", fontsize=18)
-        self.autofocus_coarse.set_xlabel("Focus Stage Position", fontsize=16)
-        self.autofocus_coarse.ticklabel_format(style="sci", axis="y", scilimits=(0, 0))
-        self.autofocus_coarse.yaxis.set_minor_locator(tck.AutoMinorLocator())
-        self.autofocus_coarse.xaxis.set_minor_locator(tck.AutoMinorLocator())
-        self.autofocus_fig.tight_layout()
         self.autofocus_fig.canvas.draw_idle()
 
     @property
@@ -113,8 +113,7 @@ class CameraMapSettingPopupController(GUIController):
         """Create offset and variance maps from a series of dark frames."""
         # TODO: This should not be in the controller logic.
         image_name = self.view.file_name.get()
-        im = tifffile.imread(image_name)
-        self.off, self.var = compute_scmos_offset_and_variance_map(im)
+        self.off, self.var = compute_scmos_offset_and_variance_map(image_name)
 
         self.display_plot()
 
@@ -123,6 +123,9 @@ class ChannelsTabController(GUIController):
         #: dict: The microscope state dictionary.
         self.microscope_state_dict = {}
 
+        #: dict: Pending forwarded commands, keyed by command and setting name.
+        self.forward_event_ids = {}
+
         # laser/stack cycling event binds
         self.stack_acq_vals["cycling"].trace_add("write", self.update_cycling_setting)
 
@@ -793,9 +796,16 @@ class ChannelsTabController(GUIController):
                 exposure_time
             )
         elif (command == "channel") or (command == "update_setting"):
-            self.view.after(
-                1000, lambda: self.parent_controller.execute(command, *args)
-            )
+            # coalesce repeated requests so the model only recalculates once
+            event_key = (command, args[0] if args else None)
+            if self.forward_event_ids.get(event_key):
+                self.view.after_cancel(self.forward_event_ids[event_key])
+
+            def forward():
+                self.forward_event_ids.pop(event_key, None)
+                self.parent_controller.execute(command, *args)
+
+            self.forward_event_ids[event_key] = self.view.after(1000, forward)
 
         self.show_verbose_info("Received command from child", command, args)
 
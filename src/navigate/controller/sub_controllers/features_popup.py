@@ -344,7 +344,7 @@ class FeatureListGraphController:
                 btn.bind("<Button-3>", self.show_menu(i, flag))
 
             if i == 0:
-                self.feature_list_view.update()
+                self.feature_list_view.update_idletasks()
                 feature_icon_width = btn.winfo_width()
             if i < l:
                 al = ArrowLabel(
@@ -356,7 +356,7 @@ class FeatureListGraphController:
                 )
                 al.grid(row=0, column=i * 2 + 1, sticky="", pady=(30, 0))
                 if i == 0:
-                    self.feature_list_view.update()
+                    self.feature_list_view.update_idletasks()
                     al_width = al.winfo_width()
         # draw loop arrows
         image_width = feature_icon_width * (l + 1) + al_width * l
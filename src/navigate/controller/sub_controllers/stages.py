@@ -32,6 +32,7 @@
 
 # Standard Library Imports
 import tkinter as tk
+import time
 from multiprocessing.managers import ListProxy, DictProxy
 import logging
 
@@ -45,6 +46,12 @@ from navigate.tools.decorators import log_initialization
 p = __name__.split(".")[1]
 logger = logging.getLogger(p)
 
+# Position axes, in the order they are shown
+AXES = ("x", "y", "z", "theta", "f")
+
+# Step size variable shared by each position axis
+STEP_AXES = {"x": "xy", "y": "xy", "z": "z", "theta": "theta", "f": "f"}
+
 
 @log_initialization
 class StageController(GUIController):
@@ -95,8 +102,21 @@ class StageController(GUIController):
             "StageParameters"
         ]
 
-        #: dict: The event id
-        self.event_id = {"x": None, "y": None, "z": None, "theta": None, "f": None}
+        #: str: The event id of the pending stage movement
+        self.event_id = None
+
+        #: dict: Positions waiting to be sent to the stage, by axis
+        self.pending_positions = {}
+
+        #: float: Minimum time between two stage movements, in seconds
+        self.min_move_interval = 0.05
+
+        #: float: Delay before positions held back by min_move_interval are sent,
+        #: in seconds
+        self.debounce_delay = 0.5
+
+        #: float: Monotonic time of the last stage movement
+        self.last_move_time = 0.0
 
         # stage movement limits
         #: dict: The minimum stage position.
@@ -111,15 +131,20 @@ class StageController(GUIController):
 
         # gui event bind
         buttons = self.view.get_buttons()
-        for k in buttons:
-            if k[:2] == "up":
-                buttons[k].configure(command=self.up_btn_handler(k[3:-4]))
-            elif k[:4] == "down":
-                buttons[k].configure(command=self.down_btn_handler(k[5:-4]))
-            elif k[5:-4] == "xy":
-                buttons[k].configure(command=self.xy_zero_btn_handler())
-            elif k.startswith("zero"):
-                buttons[k].configure(command=self.zero_btn_handler(k[5:-4]))
+        # button names are "<kind>_<axis>_btn", e.g. "up_x_btn" or "zero_xy_btn"
+        button_handlers = {
+            "up": self.up_btn_handler,
+            "down": self.down_btn_handler,
+            "zero": self.zero_btn_handler,
+        }
+        for name, button in buttons.items():
+            kind, _, axis = name[: -len("_btn")].partition("_")
+            if kind not in button_handlers:
+                continue
+            if kind == "zero" and axis == "xy":
+                button.configure(command=self.xy_zero_btn_handler())
+            else:
+                button.configure(command=button_handlers[kind](axis))
 
         for k in ["xy", "z", "f", "theta"]:
             self.widget_vals[k + "_step"].trace_add(
@@ -133,6 +158,9 @@ class StageController(GUIController):
         #: dict: The position callback traces
         self.position_callback_traces = {}
 
+        #: dict: The debounced position handler of each axis
+        self.position_callbacks = {}
+
         #: bool: The position callbacks are bound
         self.position_callbacks_bound = False
 
@@ -182,14 +210,11 @@ class StageController(GUIController):
 
         widgets = self.view.get_widgets()
         step_dict = self.stage_setting_dict[config.microscope_name]
-        for axis in ["x", "y", "z", "theta", "f"]:
+        for axis in AXES:
             # Set Stage Limits
             widgets[axis].widget.min = self.position_min[axis]
             widgets[axis].widget.max = self.position_max[axis]
-            if axis == "x" or axis == "y":
-                step_axis = "xy"
-            else:
-                step_axis = axis
+            step_axis = STEP_AXES[axis]
 
             # Set step size.
             # the minimum step should be non-zero and non-negative.
@@ -287,7 +312,7 @@ class StageController(GUIController):
         unbind later."""
         widgets = self.view.get_widgets()
         if not self.position_callbacks_bound:
-            for axis in ["x", "y", "z", "theta", "f"]:
+            for axis in AXES:
                 # add event bind to position entry variables
                 widgets[axis].widget.bind("<FocusOut>", self.position_callback(axis))
                 # cbname = self.widget_vals[axis].trace_add(
@@ -321,10 +346,11 @@ class StageController(GUIController):
         position : dict
             {'x': value, 'y': value, 'z': value, 'theta': value, 'f': value}
         """
-        for axis in ["x", "y", "z", "theta", "f"]:
+        for axis in AXES:
             if axis not in position:
                 continue
-            self.widget_vals[axis].set(position[axis])
+            if not self.is_position_shown(axis, position[axis]):
+                self.widget_vals[axis].set(position[axis])
             self.position_callback(axis)()
         self.show_verbose_info("Set stage position")
 
@@ -337,16 +363,39 @@ class StageController(GUIController):
             {'x': value, 'y': value, 'z': value, 'theta': value, 'f': value}
         """
         widgets = self.view.get_widgets()
-        for axis in ["x", "y", "z", "theta", "f"]:
+        for axis in AXES:
             if axis not in position:
                 continue
-            self.widget_vals[axis].set(position[axis])
-            # validate position value if set through variable
-            if self.stage_limits:
-                widgets[axis].widget.trigger_focusout_validation()
+            if not self.is_position_shown(axis, position[axis]):
+                self.widget_vals[axis].set(position[axis])
+                # validate position value if set through variable
+                if self.stage_limits:
+                    widgets[axis].widget.trigger_focusout_validation()
             self.stage_setting_dict[axis] = position.get(axis, 0)
         self.show_verbose_info("Set stage position")
 
+    def is_position_shown(self, axis, value):
+        """Check whether the position entry of an axis already shows a value.
+
+        Writing an unchanged value would only redraw the entry and validate it again.
+
+        Parameters
+        ----------
+        axis : str
+            axis can be 'x', 'y', 'z', 'theta', 'f'
+        value : float
+            Position to compare with.
+
+        Returns
+        -------
+        bool
+            True if the entry already holds the value.
+        """
+        try:
+            return float(self.widget_vals[axis].get()) == value
+        except (ValueError, TypeError, tk.TclError):
+            return False
+
     def get_position(self):
         """This function returns current position from the view.
 
@@ -358,7 +407,7 @@ class StageController(GUIController):
         """
         position = {}
         try:
-            for axis in ["x", "y", "z", "theta", "f"]:
+            for axis in AXES:
                 position[axis] = float(self.widget_vals[axis].get())
                 if self.stage_limits is True:
                     if (
@@ -387,18 +436,18 @@ class StageController(GUIController):
         handler : object
             Function for setting desired stage positions in the View.
         """
-        position_val = self.widget_vals[axis]
-        if axis == "x" or axis == "y":
-            step_val = self.widget_vals["xy_step"]
-        else:
-            step_val = self.widget_vals[axis + "_step"]
+        # bound once here rather than looked up on every click
+        get_position = self.widget_vals[axis].get
+        set_position = self.widget_vals[axis].set
+        get_step = self.widget_vals[STEP_AXES[axis] + "_step"].get
 
         def handler():
             """This function generates command functions according to the desired axis
             to move."""
             stage_direction = -1 if self.flip_flags[axis] else 1
             try:
-                temp = float(position_val.get()) + step_val.get() * stage_direction
+                position = float(get_position())
+                temp = position + get_step() * stage_direction
             except tk._tkinter.TclError:
                 return
             if self.stage_limits is True:
@@ -407,8 +456,8 @@ class StageController(GUIController):
                 elif temp < self.position_min[axis]:
                     temp = self.position_min[axis]
             # guarantee stage won't move out of limits
-            if float(position_val.get()) != temp:
-                position_val.set(temp)
+            if position != temp:
+                set_position(temp)
                 self.position_callback(axis)()
 
         return handler
@@ -428,18 +477,18 @@ class StageController(GUIController):
         handler : object
             Function for setting desired stage positions in the View.
         """
-        position_val = self.widget_vals[axis]
-        if axis == "x" or axis == "y":
-            step_val = self.widget_vals["xy_step"]
-        else:
-            step_val = self.widget_vals[axis + "_step"]
+        # bound once here rather than looked up on every click
+        get_position = self.widget_vals[axis].get
+        set_position = self.widget_vals[axis].set
+        get_step = self.widget_vals[STEP_AXES[axis] + "_step"].get
 
         def handler():
             """This function generates command functions according to the desired axis
             to move."""
             stage_direction = -1 if self.flip_flags[axis] else 1
             try:
-                temp = float(position_val.get()) - step_val.get() * stage_direction
+                position = float(get_position())
+                temp = position - get_step() * stage_direction
             except tk._tkinter.TclError:
                 return
             if self.stage_limits is True:
@@ -448,8 +497,8 @@ class StageController(GUIController):
                 elif temp > self.position_max[axis]:
                     temp = self.position_max[axis]
             # guarantee stage won't move out of limits
-            if float(position_val.get()) != temp:
-                position_val.set(temp)
+            if position != temp:
+                set_position(temp)
                 self.position_callback(axis)()
 
         return handler
@@ -498,7 +547,7 @@ class StageController(GUIController):
 
     def stop_button_handler(self, *args):
         """This function stops the stage after a 250 ms debouncing period of time."""
-        self.view.after(250, lambda *args: self.parent_controller.execute("stop_stage"))
+        self.view.after(250, self.parent_controller.execute, "stop_stage")
 
     def joystick_button_handler(self, event=None, *args):
         """Toggle the joystick operation mode.
@@ -512,9 +561,7 @@ class StageController(GUIController):
             self.joystick_is_on = False
         else:
             self.joystick_is_on = True
-        self.view.after(
-            250, lambda *args: self.parent_controller.execute("joystick_toggle")
-        )
+        self.view.after(250, self.parent_controller.execute, "joystick_toggle")
         self.view.toggle_button_states(self.joystick_is_on, self.joystick_axes)
 
     def force_enable_all_axes(self, event=None, *args):
@@ -533,7 +580,9 @@ class StageController(GUIController):
         """Callback functions bind to position variables.
 
         Implements debounce functionality for user inputs (or click buttons) to reduce
-        time costs of moving stage.
+        time costs of moving stage. A change moves the stage right away if it has not
+        moved within min_move_interval, other changes are sent to the stage as a
+        single movement once debounce_delay has elapsed without further input.
 
         Parameters
         ----------
@@ -546,8 +595,11 @@ class StageController(GUIController):
         -------
         handler : object
             Function for moving stage to the desired position with debounce
-            functionality.
+            functionality. The handler is created once per axis and reused.
         """
+        if axis in self.position_callbacks:
+            return self.position_callbacks[axis]
+
         position_var = self.widget_vals[axis]
         temp = self.view.get_widgets()
         widget = temp[axis].widget
@@ -557,8 +609,8 @@ class StageController(GUIController):
             # check if focus on another window
             if not self.view.focus_get():
                 return
-            if self.event_id[axis]:
-                self.view.after_cancel(self.event_id[axis])
+            # drop any move still pending for this axis
+            self.pending_positions.pop(axis, None)
             # if position is not a number, then do not move stage
             try:
                 position = float(position_var.get())
@@ -570,8 +622,6 @@ class StageController(GUIController):
                     ):
                         return
             except tk._tkinter.TclError:
-                if self.event_id[axis]:
-                    self.view.after_cancel(self.event_id[axis])
                 return
             except AttributeError:
                 logger.error(f"Attribute Error Caught: trying to set position {axis}")
@@ -579,18 +629,34 @@ class StageController(GUIController):
 
             # update stage position
             self.stage_setting_dict[axis] = position
+            self.pending_positions[axis] = position
             # Debouncing wait duration - Duration of time to integrate the number of
-            # clicks that a user provides. If 1000 ms, if user hits button 10x within
-            # 1s, only moves to the final value.
-            self.event_id[axis] = self.view.after(
-                500,
-                lambda *args: self.parent_controller.execute("stage", position, axis),
+            # clicks that a user provides. The stage moves right away if it has not
+            # moved within min_move_interval, so continuous input moves it at most
+            # once per interval, and once more to the final value after
+            # debounce_delay.
+            if self.event_id:
+                self.view.after_cancel(self.event_id)
+            if time.monotonic() - self.last_move_time >= self.min_move_interval:
+                self.move_pending_positions()
+            self.event_id = self.view.after(
+                int(self.debounce_delay * 1000), self.move_pending_positions
             )
 
             self.show_verbose_info("Stage position changed")
 
+        self.position_callbacks[axis] = handler
         return handler
 
+    def move_pending_positions(self, *args):
+        """Send all positions entered since the last movement to the stage."""
+        self.event_id = None
+        if not self.pending_positions:
+            return
+        positions, self.pending_positions = self.pending_positions, {}
+        self.last_move_time = time.monotonic()
+        self.parent_controller.execute("stage", positions)
+
     def update_step_size_handler(self, axis):
         """Callback functions bind to step size variables
 
@@ -32,6 +32,7 @@
 
 # Standard library imports
 import logging
+import tkinter as tk
 
 # Third-party imports
 
@@ -131,10 +132,20 @@ class WaveformPopupController(GUIController):
         #: dict: Dictionary of galvo maximum values
         self.galvo_max = {}
 
+        #: dict: Remote focus constants of each laser for the shown resolution and
+        #: magnification
+        self.current_remote_focus_constants = {}
+
+        #: dict: Constants of each galvo for the shown resolution and magnification
+        self.current_galvo_constants = {}
+
         # event id list
         #: int: The event id.
         self.event_id = None
 
+        #: list: Settings waiting to be sent to the parent controller.
+        self.pending_settings = []
+
         # Event Binding
         # Switching microscopes modes (e.g., meso, nano, etc.)
         self.widgets["Mode"].widget.bind(
@@ -198,12 +209,13 @@ class WaveformPopupController(GUIController):
             command=self.display_advanced_setting_window
         )
 
-        # Save waveform constants upon closing the popup window
+        # Save waveform constants upon closing the popup window. The save blocks,
+        # because the controller is deleted and can no longer save on exit.
         self.view.popup.protocol(
             "WM_DELETE_WINDOW",
             combine_funcs(
                 self.restore_amplitude,
-                self.save_waveform_constants,
+                lambda: self.save_waveform_constants(blocking=True),
                 self.view.popup.dismiss,
                 lambda: delattr(self.parent_controller, "waveform_popup_controller"),
             ),
@@ -262,45 +274,36 @@ class WaveformPopupController(GUIController):
             self.increment = -self.increment
 
         # set ranges of value for those lasers
+        # TODO: The offset bounds should adjust based on the amplitude bounds,
+        #       so that amp + offset does not exceed the bounds. Can be done
+        #       in update_remote_focus_settings()
         for laser in self.lasers:
-            self.widgets[laser + " Amp"].widget.configure(from_=self.laser_min)
-            self.widgets[laser + " Amp"].widget.configure(to=self.laser_max)
-            self.widgets[laser + " Amp"].widget.configure(increment=self.increment)
-            self.widgets[laser + " Amp"].widget.set_precision(precision)
-            self.widgets[laser + " Amp"].widget.trigger_focusout_validation()
-            # TODO: The offset bounds should adjust based on the amplitude bounds,
-            #       so that amp + offset does not exceed the bounds. Can be done
-            #       in update_remote_focus_settings()
-            self.widgets[laser + " Off"].widget.configure(from_=self.laser_min)
-            self.widgets[laser + " Off"].widget.configure(to=self.laser_max)
-            self.widgets[laser + " Off"].widget.configure(increment=self.increment)
-            self.widgets[laser + " Off"].widget.set_precision(precision)
-            self.widgets[laser + " Off"].widget.trigger_focusout_validation()
+            for name in (laser + " Amp", laser + " Off"):
+                widget = self.widgets[name].widget
+                widget.configure(
+                    from_=self.laser_min, to=self.laser_max, increment=self.increment
+                )
+                widget.set_precision(precision)
+                widget.trigger_focusout_validation()
 
         for galvo, d in zip(self.galvos, self.galvo_dict):
             galvo_min = d["hardware"]["min"]
             galvo_max = d["hardware"]["max"]
-            self.widgets[galvo + " Amp"].widget.configure(from_=galvo_min)
-            self.widgets[galvo + " Amp"].widget.configure(to=galvo_max)
-            self.widgets[galvo + " Amp"].widget.configure(increment=self.increment)
-            self.widgets[galvo + " Amp"].widget.set_precision(precision)
-            self.widgets[galvo + " Amp"].widget["state"] = "normal"
-            self.widgets[galvo + " Amp"].widget.trigger_focusout_validation()
-            # TODO: The offset bounds should adjust based on the amplitude bounds,
-            #       so that amp + offset does not exceed the bounds. Can be done
-            #       in update_remote_focus_settings()
-            self.widgets[galvo + " Off"].widget.configure(from_=galvo_min)
-            self.widgets[galvo + " Off"].widget.configure(to=galvo_max)
-            self.widgets[galvo + " Off"].widget.configure(increment=self.increment)
-            self.widgets[galvo + " Off"].widget.set_precision(precision)
-            self.widgets[galvo + " Off"].widget["state"] = "normal"
-            self.widgets[galvo + " Off"].widget.trigger_focusout_validation()
-
-            self.widgets[galvo + " Freq"].widget.configure(from_=0)
-            self.widgets[galvo + " Freq"].widget.configure(increment=self.increment)
-            self.widgets[galvo + " Freq"].widget.set_precision(precision)
-            self.widgets[galvo + " Freq"].widget["state"] = "normal"
-            self.widgets[galvo + " Freq"].widget.trigger_focusout_validation()
+            for name in (galvo + " Amp", galvo + " Off"):
+                widget = self.widgets[name].widget
+                widget.configure(
+                    from_=galvo_min,
+                    to=galvo_max,
+                    increment=self.increment,
+                    state="normal",
+                )
+                widget.set_precision(precision)
+                widget.trigger_focusout_validation()
+
+            widget = self.widgets[galvo + " Freq"].widget
+            widget.configure(from_=0, increment=self.increment, state="normal")
+            widget.set_precision(precision)
+            widget.trigger_focusout_validation()
 
             self.galvo_min[galvo] = galvo_min
             self.galvo_max[galvo] = galvo_max
@@ -355,6 +358,13 @@ class WaveformPopupController(GUIController):
         *args : tuple
             The first element is the new focus mode.
         """
+        # re-selecting the shown mode in the combobox changes nothing
+        if (
+            args
+            and isinstance(args[0], tk.Event)
+            and self.widgets["Mode"].widget.get() == self.resolution
+        ):
+            return
         # restore amplitude before change resolution if needed
         self.restore_amplitude()
         # get resolution setting
@@ -380,39 +390,49 @@ class WaveformPopupController(GUIController):
         *args : tuple
             The first element is the new magnification setting.
         """
+        # re-selecting the shown magnification in the combobox changes nothing
+        if (
+            args
+            and isinstance(args[0], tk.Event)
+            and self.widgets["Mag"].widget.get() == self.mag
+        ):
+            return
         # get galvo dict for the specified microscope/magnification
-        self.galvo_dict = self.parent_controller.configuration["configuration"][
-            "microscopes"
-        ][self.resolution]["galvo"]
-        self.galvos = [f"Galvo {i}" for i in range(len(self.galvo_dict))]
+        # the entries are fetched from the shared configuration list once here
+        self.galvo_dict = tuple(
+            self.parent_controller.configuration["configuration"]["microscopes"][
+                self.resolution
+            ]["galvo"]
+        )
+        self.galvos = tuple(f"Galvo {i}" for i in range(len(self.galvo_dict)))
         # restore amplitude before change mag if needed
         self.restore_amplitude()
         # get magnification setting
         self.mag = self.widgets["Mag"].widget.get()
+        # keep the constants of this resolution and magnification at hand, so the
+        # variable traces do not walk the nested configuration on every change
+        remote_focus_constants = self.resolution_info["remote_focus_constants"][
+            self.resolution
+        ][self.mag]
+        self.current_remote_focus_constants = {
+            laser: remote_focus_constants[laser] for laser in self.lasers
+        }
+        self.current_galvo_constants = {
+            galvo: self.galvo_setting[galvo][self.resolution][self.mag]
+            for galvo in self.galvos
+        }
         for laser in self.lasers:
-            self.variables[laser + " Amp"].set(
-                self.resolution_info["remote_focus_constants"][self.resolution][
-                    self.mag
-                ][laser]["amplitude"]
-            )
-            self.variables[laser + " Off"].set(
-                self.resolution_info["remote_focus_constants"][self.resolution][
-                    self.mag
-                ][laser]["offset"]
-            )
+            laser_constants = self.current_remote_focus_constants[laser]
+            self.variables[laser + " Amp"].set(laser_constants["amplitude"])
+            self.variables[laser + " Off"].set(laser_constants["offset"])
 
         # do not tell the model to update galvo
         self.update_galvo_device_flag = False
         for galvo in self.galvos:
-            self.variables[galvo + " Amp"].set(
-                self.galvo_setting[galvo][self.resolution][self.mag].get("amplitude", 0)
-            )
-            self.variables[galvo + " Off"].set(
-                self.galvo_setting[galvo][self.resolution][self.mag].get("offset", 0)
-            )
-            self.variables[galvo + " Freq"].set(
-                self.galvo_setting[galvo][self.resolution][self.mag].get("frequency", 0)
-            )
+            galvo_constants = self.current_galvo_constants[galvo]
+            self.variables[galvo + " Amp"].set(galvo_constants.get("amplitude", 0))
+            self.variables[galvo + " Off"].set(galvo_constants.get("offset", 0))
+            self.variables[galvo + " Freq"].set(galvo_constants.get("frequency", 0))
         self.update_galvo_device_flag = True
 
         # Load waveform parameters from configuration - Smooth, Delay, Duty Cycle.
@@ -474,50 +494,40 @@ class WaveformPopupController(GUIController):
         remote_focus_name : str
             The name of the remote focus setting.
         """
-        variable = self.variables[name]
+        # bound once here rather than looked up on every change
+        get_value = self.variables[name].get
+        schedule_setting_update = self.schedule_setting_update
 
         # TODO: Is this still a bug?
         # BUG Upon startup this will always run 0.63x,
         # and when changing magnification it will run 0.63x
         # before whatever mag is selected
         def func_laser(*args):
-            value = self.resolution_info["remote_focus_constants"][self.resolution][
-                self.mag
-            ][laser][remote_focus_name]
+            laser_constants = self.current_remote_focus_constants[laser]
+            value = laser_constants[remote_focus_name]
 
             # Will only run code if value in constants does not match whats in GUI
             # for Amp or Off AND in Live mode
             # TODO: Make also work in the 'single' acquisition mode.
-            variable_value = variable.get()
+            variable_value = get_value()
             logger.debug(
                 f"Remote Focus Amplitude/Offset Changed pre if statement: "
                 f"{variable_value}"
             )
             if value != variable_value and variable_value != "":
-                # tell parent controller (the device)
-                if self.event_id:
-                    self.view.popup.after_cancel(self.event_id)
-
                 try:
                     value = float(variable_value)
                 except ValueError:
                     return
                 if value < self.laser_min or value > self.laser_max:
                     return
-                self.resolution_info["remote_focus_constants"][self.resolution][
-                    self.mag
-                ][laser][remote_focus_name] = variable_value
+                laser_constants[remote_focus_name] = variable_value
                 logger.debug(
                     f"Remote Focus Amplitude/Offset Changed:, {variable_value}"
                 )
 
-                # Delay feature.
-                self.event_id = self.view.popup.after(
-                    500,
-                    lambda: self.parent_controller.execute(
-                        "update_setting", "resolution"
-                    ),
-                )
+                # tell parent controller (the device)
+                schedule_setting_update("resolution")
 
         return func_laser
 
@@ -536,8 +546,6 @@ class WaveformPopupController(GUIController):
         if not self.update_waveform_parameters_flag:
             return
 
-        if self.event_id:
-            self.view.popup.after_cancel(self.event_id)
         # Get the values from the widgets.
         try:
             delay = float(self.widgets["Delay"].widget.get())
@@ -567,12 +575,7 @@ class WaveformPopupController(GUIController):
         ] = camera_settle_duration
 
         # Pass the values to the parent controller.
-        self.event_id = self.view.popup.after(
-            500,
-            lambda: self.parent_controller.execute(
-                "update_setting", "waveform_parameters"
-            ),
-        )
+        self.schedule_setting_update("waveform_parameters")
 
     def estimate_galvo_setting(self, *args, **kwargs):
         """Digitally scanned light-sheet frequency estimation.
@@ -651,28 +654,24 @@ class WaveformPopupController(GUIController):
             The function to update the galvo setting.
         """
         name = galvo_name + widget_name
-        variable = self.variables[name]
+        # bound once here rather than looked up on every change
+        get_value = self.variables[name].get
+        schedule_setting_update = self.schedule_setting_update
 
         def func_galvo(*args):
             if not self.update_galvo_device_flag:
                 return
             try:
-                value = self.galvo_setting[galvo_name][self.resolution][self.mag][
-                    parameter
-                ]
+                value = self.current_galvo_constants[galvo_name][parameter]
             except KeyError:
                 # Special case for galvo amplitude not being defined
                 value = 0
-            variable_value = variable.get()
+            variable_value = get_value()
             logger.debug(
                 f"Galvo parameter {parameter} changed: "
                 f"{variable_value} pre if statement"
             )
             if value != variable_value and variable_value != "":
-                # change any galvo parameters as one event
-                if self.event_id:
-                    self.view.popup.after_cancel(self.event_id)
-
                 try:
                     value = float(variable_value)
                 except ValueError:
@@ -682,24 +681,36 @@ class WaveformPopupController(GUIController):
                     or value > self.galvo_max[galvo_name]
                 ):
                     return
-                self.galvo_setting[galvo_name][self.resolution][self.mag][
-                    parameter
-                ] = variable_value
+                self.current_galvo_constants[galvo_name][parameter] = variable_value
                 logger.debug(f"Galvo parameter {parameter} changed: {variable_value}")
 
-                self.event_id = self.view.popup.after(
-                    500,
-                    lambda: self.parent_controller.execute("update_setting", "galvo"),
-                )
+                # change any galvo parameters as one event
+                schedule_setting_update("galvo")
 
         return func_galvo
 
-    def save_waveform_constants(self):
-        """Save updated waveform parameters to yaml file."""
+    def save_waveform_constants(self, blocking=False):
+        """Save updated waveform parameters to yaml file.
+
+        The file is written on a background thread so the GUI does not wait for it.
+        Saves requested while one is running are queued and written in order.
+
+        Parameters
+        ----------
+        blocking : bool
+            Write the file before returning, e.g. when the popup or navigate is
+            closing.
+        """
         # errors = self.get_errors()
         # if errors:
         #     return  # Dont save if any errors TODO needs testing
-        save_yaml_file("", self.resolution_info, self.waveform_constants_path)
+        args = ("", self.resolution_info, self.waveform_constants_path)
+        if blocking:
+            save_yaml_file(*args)
+        else:
+            self.parent_controller.threads_pool.createThread(
+                "save_waveform_constants", save_yaml_file, args=args
+            )
 
     """
     Example for preventing submission of a field/controller. So if there is an error in
@@ -729,16 +740,16 @@ class WaveformPopupController(GUIController):
             self.amplitude_dict = {"resolution": self.resolution, "mag": self.mag}
 
             for laser in self.lasers:
-                self.amplitude_dict[laser] = self.resolution_info[
-                    "remote_focus_constants"
-                ][self.resolution][self.mag][laser]["amplitude"]
+                self.amplitude_dict[laser] = self.current_remote_focus_constants[laser][
+                    "amplitude"
+                ]
                 self.variables[laser + " Amp"].set(0)
                 self.widgets[laser + " Amp"].widget.config(state="disabled")
 
             for galvo in self.galvos:
-                self.amplitude_dict[galvo] = self.resolution_info["galvo_constants"][
-                    galvo
-                ][self.resolution][self.mag]["amplitude"]
+                self.amplitude_dict[galvo] = self.current_galvo_constants[galvo][
+                    "amplitude"
+                ]
                 self.variables[galvo + " Amp"].set(0)
                 self.widgets[galvo + " Amp"].widget.config(state="disabled")
 
@@ -754,16 +765,7 @@ class WaveformPopupController(GUIController):
             self.view.buttons["toggle_waveform_button"].config(state="disabled")
             self.show_laser_info()
             # call the parent controller the amplitude values are updated
-            try:
-                if self.event_id:
-                    self.view.popup.after_cancel(self.event_id)
-            except KeyError:
-                pass
-
-            self.event_id = self.view.popup.after(
-                500,
-                lambda: self.parent_controller.execute("update_setting", "galvo"),
-            )
+            self.schedule_setting_update("galvo")
             self.view.popup.after(
                 500,
                 lambda: self.view.buttons["toggle_waveform_button"].config(
@@ -779,13 +781,14 @@ class WaveformPopupController(GUIController):
             return
         resolution = self.amplitude_dict["resolution"]
         mag = self.amplitude_dict["mag"]
+        remote_focus_constants = self.resolution_info["remote_focus_constants"][
+            resolution
+        ][mag]
         for laser in self.lasers:
-            self.resolution_info["remote_focus_constants"][resolution][mag][laser][
-                "amplitude"
-            ] = self.amplitude_dict[laser]
+            remote_focus_constants[laser]["amplitude"] = self.amplitude_dict[laser]
             self.widgets[laser + " Amp"].widget.config(state="normal")
         for galvo in self.galvos:
-            self.resolution_info["galvo_constants"][galvo][resolution][mag][
+            self.galvo_setting[galvo][resolution][mag][
                 "amplitude"
             ] = self.amplitude_dict[galvo]
             self.widgets[galvo + " Amp"].widget.config(state="normal")
@@ -951,9 +954,6 @@ class WaveformPopupController(GUIController):
             except ValueError:
                 return
 
-            if self.event_id:
-                self.view.popup.after_cancel(self.event_id)
-
             parameter_name = "amplitude" if amp_or_off == "amp" else "offset"
             galvo_name = f"Galvo {galvo_id}"
             if factor_name == "All":
@@ -965,10 +965,7 @@ class WaveformPopupController(GUIController):
                     parameter_name
                 ] = value
 
-            self.event_id = self.view.popup.after(
-                500,
-                lambda: self.parent_controller.execute("update_setting", "galvo"),
-            )
+            self.schedule_setting_update("galvo")
 
         return func
 
@@ -1008,9 +1005,28 @@ class WaveformPopupController(GUIController):
                 self.widgets[galvo_name + " Amp"].widget["state"] = "normal"
                 self.widgets[galvo_name + " Off"].widget["state"] = "normal"
         self.resolution_info["other_constants"]["galvo_factor"] = galvo_factor
-        if self.event_id:
-            self.view.popup.after_cancel(self.event_id)
-        self.event_id = self.view.popup.after(
-            500,
-            lambda: self.parent_controller.execute("update_setting", "galvo"),
-        )
+        self.schedule_setting_update("galvo")
+
+    def schedule_setting_update(self, setting_name):
+        """Send a setting to the parent controller after a 500 ms delay.
+
+        Settings changed before the delay has elapsed are sent together with it,
+        each one once.
+
+        Parameters
+        ----------
+        setting_name : str
+            The setting to update: 'resolution', 'galvo' or 'waveform_parameters'.
+        """
+        if setting_name not in self.pending_settings:
+            self.pending_settings.append(setting_name)
+        if self.event_id is None:
+            self.event_id = self.view.popup.after(500, self.update_pending_settings)
+
+    def update_pending_settings(self):
+        """Send all settings changed since the last update to the parent
+        controller."""
+        self.event_id = None
+        settings, self.pending_settings = self.pending_settings, []
+        for setting_name in settings:
+            self.parent_controller.execute("update_setting", setting_name)
@@ -254,7 +254,7 @@ class WaveformTabController(GUIController):
                 np.arange(len(remote_focus_waveform) * waveform_repeat_total_num)
                 / self.sample_rate
                 + last_etl,
-                np.hstack([remote_focus_waveform] * waveform_repeat_total_num),
+                np.tile(remote_focus_waveform, waveform_repeat_total_num),
                 label=label,
             )
             # ax = self.view.plot_galvo.axis
@@ -264,22 +264,27 @@ class WaveformTabController(GUIController):
                     np.arange(len(galvo_waveform) * waveform_repeat_total_num)
                     / self.sample_rate
                     + last_galvo,
-                    np.hstack([galvo_waveform] * waveform_repeat_total_num),
+                    np.tile(galvo_waveform, waveform_repeat_total_num),
                     label=label,
                 )
-            self.view.plot_etl.plot(
+            # The camera trace is drawn on both axes, so only expand it once.
+            camera_time = (
                 np.arange(len(camera_waveform) * waveform_repeat_total_num)
                 / self.sample_rate
-                + last_camera,
-                np.hstack([camera_waveform] * waveform_repeat_total_num),
+                + last_camera
+            )
+            camera_waveform_expanded = np.tile(
+                camera_waveform, waveform_repeat_total_num
+            )
+            self.view.plot_etl.plot(
+                camera_time,
+                camera_waveform_expanded,
                 c="k",
                 linestyle="--",
             )
             self.view.plot_galvo.plot(
-                np.arange(len(camera_waveform) * waveform_repeat_total_num)
-                / self.sample_rate
-                + last_camera,
-                np.hstack([camera_waveform] * waveform_repeat_total_num),
+                camera_time,
+                camera_waveform_expanded,
                 c="k",
                 linestyle="--",
             )
@@ -39,7 +39,6 @@ import os
 
 # Local Imports
 from navigate.controller.controller import Controller
-from navigate.controller.configurator import Configurator
 from navigate.log_files.log_functions import log_setup
 from navigate.view.splash_screen import SplashScreen
 from navigate.tools.main_functions import (
@@ -80,6 +79,11 @@ def main():
             "on MacOS. Testing on Linux operating systems has not been performed."
         )
 
+    # Parse command line arguments before bringing up Tk, so that --help and
+    # invalid arguments exit without paying for the GUI runtime.
+    parser = create_parser()
+    args = parser.parse_args()
+
     # Start the GUI, withdraw main screen, and show splash screen.
     root = tk.Tk()
     root.withdraw()
@@ -90,10 +94,6 @@ def main():
         root, os.path.join(current_directory, "view", "icon", "splash_screen_image.png")
     )
 
-    # Parse command line arguments
-    parser = create_parser()
-    args = parser.parse_args()
-
     (
         configuration_path,
         experiment_path,
@@ -108,6 +108,9 @@ def main():
     log_setup("logging.yml", logging_path)
 
     if args.configurator:
+        # Only needed for the configuration assistant, so import it on demand.
+        from navigate.controller.configurator import Configurator
+
         Configurator(root, splash_screen)
     else:
         Controller(
@@ -31,6 +31,9 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 # Standard library imports
+import os
+from functools import lru_cache
+from typing import Union
 
 # Third-party imports
 import numpy as np
@@ -45,26 +48,114 @@ import numpy.typing as npt
 
 
 def compute_scmos_offset_and_variance_map(
-    image: npt.ArrayLike,
+    image: Union[npt.ArrayLike, str, os.PathLike],
 ) -> tuple[npt.ArrayLike, npt.ArrayLike]:
     """Compute the offset and variance map of an sCMOS camera.
 
     Parameters
     ----------
-    image : npt.ArrayLike
-        ZYX image of multiple dark camera frames, taken sequentially.
+    image : npt.ArrayLike or str or os.PathLike
+        ZYX image of multiple dark camera frames, taken sequentially, or the path
+        of a TIFF file holding them. Uncompressed TIFF files are memory-mapped, so
+        stacks larger than the available memory can be used.
 
     Returns
     -------
     offset_map : npt.ArrayLike
         XY image of camera offset in the absence of signal.
+    variance_map : npt.ArrayLike
+        XY image of camera variance in the absence of signal.
     """
-    offset_map = np.mean(image, axis=0).astype(image.dtype)
-    variance_map = np.var(image, axis=0).astype(image.dtype)
+    if isinstance(image, (str, os.PathLike)):
+        import tifffile
+
+        try:
+            image = tifffile.memmap(image, mode="r")
+        except ValueError:
+            # compressed or fragmented files cannot be memory-mapped
+            image = tifffile.imread(image)
+    image = np.asarray(image)
+    n_frames = image.shape[0]
+
+    # Accumulate the sum and the sum of squares of the deviations from the first
+    # frame, frame by frame. This reads the stack once and keeps the float64
+    # temporaries the size of a single frame. Shifting by a frame close to the
+    # mean avoids the cancellation of sum(x^2) / n - mean^2 on large offsets.
+    shift = image[0].astype(np.float64)
+    shifted_sum = np.zeros(image.shape[1:], dtype=np.float64)
+    shifted_sum_sq = np.zeros(image.shape[1:], dtype=np.float64)
+    deviation = np.empty(image.shape[1:], dtype=np.float64)
+    for frame in image:
+        np.subtract(frame, shift, out=deviation)
+        np.add(shifted_sum, deviation, out=shifted_sum)
+        np.multiply(deviation, deviation, out=deviation)
+        np.add(shifted_sum_sq, deviation, out=shifted_sum_sq)
+
+    shifted_mean = shifted_sum / n_frames
+    mean = shift + shifted_mean
+    variance = shifted_sum_sq / n_frames - shifted_mean * shifted_mean
+    # rounding can leave tiny negative values where the variance is ~0
+    np.maximum(variance, 0, out=variance)
+
+    offset_map = mean.astype(image.dtype)
+    variance_map = variance.astype(image.dtype)
 
     return offset_map, variance_map
 
 
+@lru_cache(maxsize=1)
+def _import_gaussian_blur_modules():
+    """Import the Gaussian filter implementations on first use.
+
+    A failed import of OpenCV is not cached by Python, so it would search the
+    import path again on every call without this.
+
+    Returns
+    -------
+    cv2 : module or None
+        OpenCV, or None if it is not installed.
+    gaussian_filter : function or None
+        scipy.ndimage.gaussian_filter if OpenCV is not installed, None otherwise.
+    """
+    try:
+        import cv2
+    except ImportError:
+        from scipy.ndimage import gaussian_filter
+
+        return None, gaussian_filter
+    return cv2, None
+
+
+def _gaussian_blur(image: npt.ArrayLike, sigma: float) -> npt.ArrayLike:
+    """Gaussian blur of a 2D image.
+
+    Uses OpenCV's vectorised, multithreaded filter when it is installed and falls
+    back to scipy otherwise. Both use a kernel radius of 4 sigma and mirror the
+    image at its borders, so they give the same result.
+
+    Parameters
+    ----------
+    image : npt.ArrayLike
+        XY image to blur.
+    sigma : float
+        Standard deviation of the Gaussian kernel in pixels.
+
+    Returns
+    -------
+    blurred : npt.ArrayLike
+        XY image after blurring.
+    """
+    cv2, gaussian_filter = _import_gaussian_blur_modules()
+    if cv2 is None:
+        return gaussian_filter(image, sigma)
+
+    image = np.asarray(image, dtype=np.float64)
+    ksize = 2 * int(4 * sigma + 0.5) + 1
+    return cv2.GaussianBlur(
+        image, (ksize, ksize), sigmaX=sigma, sigmaY=sigma, borderType=cv2.BORDER_REFLECT
+    )
+
+
 def compute_flatfield_map(
     image: npt.ArrayLike, offset_map: npt.ArrayLike, local: bool = False
 ) -> npt.ArrayLike:
@@ -85,14 +176,15 @@ def compute_flatfield_map(
     flatfield_map : npt.ArrayLike
         XY image of flatfield map.
     """
+    # offset_image is a new array, so the normalisation below works on it in place
     offset_image = np.mean(image, axis=0) - offset_map
     if local:
-        from scipy.ndimage import gaussian_filter
-
-        gaussian_image = gaussian_filter(offset_image, 9)
-        return offset_image / (gaussian_image + 1)
+        gaussian_image = _gaussian_blur(offset_image, 9)
+        gaussian_image += 1
+        offset_image /= gaussian_image
     else:
-        return offset_image / (np.max(np.abs(offset_image)) + 1)
+        offset_image /= np.abs(offset_image).max() + 1
+    return offset_image
 
 
 def compute_noise_sigma(Fn=1.0, qe=0.82, S=0.0, Ib=0.0, Nr=1.4, M=1.0):
@@ -118,7 +210,13 @@ def compute_noise_sigma(Fn=1.0, qe=0.82, S=0.0, Ib=0.0, Nr=1.4, M=1.0):
     noise : float or np.array
         Estimated noise model (electrons)
     """
-    noise = np.sqrt(Fn * Fn * qe * (S + Ib) + (Nr / M) ** 2)
+    noise = np.add(S, Ib, dtype=np.result_type(S, Ib, 1.0))
+    if np.ndim(noise) == 0:
+        return np.sqrt(Fn * Fn * qe * noise + (Nr / M) ** 2)
+    # per-pixel maps are updated in place rather than through full-size temporaries
+    noise *= Fn * Fn * qe
+    noise += (Nr / M) ** 2
+    np.sqrt(noise, out=noise)
     return noise
 
 
@@ -139,10 +237,16 @@ def compute_signal_to_noise(image, offset_map, variance_map):
     snr : np.array
         XY image of signal-to-noise ratio.
     """
-    S = image.astype(float) - offset_map.astype(float)
-    S[S < 0] = 0  # clip
-    N = np.sqrt(S + variance_map.astype(float) + 1.0)  # +1 to avoid div by zero error
+    # astype returns a copy, so the caller's image is never modified and the
+    # remaining steps can reuse S and N in place
+    S = image.astype(float)
+    S -= offset_map
+    np.maximum(S, 0, out=S)  # clip
+    N = S + variance_map
+    N += 1.0  # +1 to avoid div by zero error
+    np.sqrt(N, out=N)
     # print(f"Image min: {image.min()} offset_map min: {offset_map.min()}
     # S min: {S.min()} variance_map min: {variance_map.min()} N min: {N.min()}")
 
-    return 1.0 * S / N
+    S /= N
+    return S
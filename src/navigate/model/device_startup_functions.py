@@ -57,6 +57,39 @@ p = __name__.split(".")[1]
 logger = logging.getLogger(p)
 
 
+#: dict: Camera (module, class name) pair for each configured camera type.
+CAMERA_CLASSES = {
+    "HamamatsuOrca": ("navigate.model.devices.camera.hamamatsu", "HamamatsuOrca"),
+    "HamamatsuOrcaLightning": (
+        "navigate.model.devices.camera.hamamatsu",
+        "HamamatsuOrcaLightning",
+    ),
+    "HamamatsuOrcaFire": (
+        "navigate.model.devices.camera.hamamatsu",
+        "HamamatsuOrcaFire",
+    ),
+    "HamamatsuOrcaFusion": (
+        "navigate.model.devices.camera.hamamatsu",
+        "HamamatsuOrcaFusion",
+    ),
+    "Photometrics": ("navigate.model.devices.camera.photometrics", "PhotometricsBase"),
+    "SyntheticCamera": ("navigate.model.devices.camera.synthetic", "SyntheticCamera"),
+}
+
+#: frozenset: Camera types that share the Hamamatsu DCAM connection.
+HAMAMATSU_CAMERAS = frozenset(
+    (
+        "HamamatsuOrca",
+        "HamamatsuOrcaLightning",
+        "HamamatsuOrcaFire",
+        "HamamatsuOrcaFusion",
+    )
+)
+
+#: frozenset: Lower-case names accepted for the synthetic camera.
+SYNTHETIC_CAMERA_ALIASES = frozenset(("syntheticcamera", "synthetic"))
+
+
 class DummyDeviceConnection:
     """Dummy Device"""
 
@@ -211,19 +244,14 @@ def load_camera_connection(
             "type"
         ]
 
-    if cam_type in [
-        "HamamatsuOrca",
-        "HamamatsuOrcaLightning",
-        "HamamatsuOrcaFire",
-        "HamamatsuOrcaFusion",
-    ]:
+    if cam_type in HAMAMATSU_CAMERAS:
         # Locally Import Hamamatsu API and Initialize Camera Controller
         HamamatsuController = importlib.import_module(
             "navigate.model.devices.APIs.hamamatsu.HamamatsuAPI"
         )
         return auto_redial(HamamatsuController.DCAM, (camera_id,), exception=Exception)
 
-    elif cam_type.lower() == "syntheticcamera" or cam_type.lower() == "synthetic":
+    elif cam_type.lower() in SYNTHETIC_CAMERA_ALIASES:
         from navigate.model.devices.camera.synthetic import (
             SyntheticCameraController,
         )
@@ -285,37 +313,17 @@ def start_camera(
             "camera"
         ]["hardware"]["type"]
 
-    if cam_type == "HamamatsuOrca":
-        from navigate.model.devices.camera.hamamatsu import HamamatsuOrca
-
-        return HamamatsuOrca(microscope_name, device_connection, configuration)
-
-    elif cam_type == "HamamatsuOrcaLightning":
-        from navigate.model.devices.camera.hamamatsu import HamamatsuOrcaLightning
-
-        return HamamatsuOrcaLightning(microscope_name, device_connection, configuration)
-
-    elif cam_type == "HamamatsuOrcaFire":
-        from navigate.model.devices.camera.hamamatsu import HamamatsuOrcaFire
-
-        return HamamatsuOrcaFire(microscope_name, device_connection, configuration)
-
-    elif cam_type == "HamamatsuOrcaFusion":
-        from navigate.model.devices.camera.hamamatsu import HamamatsuOrcaFusion
-
-        return HamamatsuOrcaFusion(microscope_name, device_connection, configuration)
-
-    elif cam_type == "Photometrics":
-        from navigate.model.devices.camera.photometrics import PhotometricsBase
-
-        return PhotometricsBase(microscope_name, device_connection, configuration)
-
-    elif cam_type.lower() == "syntheticcamera" or cam_type.lower() == "synthetic":
-        from navigate.model.devices.camera.synthetic import SyntheticCamera
+    camera_class = CAMERA_CLASSES.get(cam_type)
+    if camera_class is None and cam_type.lower() in SYNTHETIC_CAMERA_ALIASES:
+        camera_class = CAMERA_CLASSES["SyntheticCamera"]
 
-        return SyntheticCamera(microscope_name, device_connection, configuration)
+    if camera_class is not None:
+        # Import the camera module only when that camera type is requested.
+        module_name, class_name = camera_class
+        camera = getattr(importlib.import_module(module_name), class_name)
+        return camera(microscope_name, device_connection, configuration)
 
-    elif "camera" in plugin_devices:
+    if "camera" in plugin_devices:
         for start_function in plugin_devices["camera"]["start_device"]:
             try:
                 return start_function(
@@ -522,7 +530,7 @@ def load_stages(
                      exception=Exception
                      )
                 )
-        elif stage_type == "KST101" and platform.system=="Windows":
+        elif stage_type == "KST101" and platform.system() == "Windows":
             from navigate.model.devices.stages.tl_kcube_steppermotor import (
                 build_TLKSTStage_connection,
             )
@@ -1,9 +1,11 @@
 import logging
+import platform
+import select
+from functools import cached_property
 
 import serial
 import re
-
-# from time import time
+from time import perf_counter
 
 from navigate.model.devices.lasers.base import LaserBase
 
@@ -11,8 +13,49 @@ from navigate.model.devices.lasers.base import LaserBase
 p = __name__.split(".")[1]
 logger = logging.getLogger(p)
 
+#: bytes: Frame delimiters used by the LuxX serial protocol.
+COMMAND_PREFIX = b"?"
+TERMINATOR = b"\r"
+LINE_FEED = b"\n"
+
+#: bytes: Non-ASCII field separator in replies, and its printable replacement.
+SEPARATOR_IN = b"\xa7"
+SEPARATOR_OUT = b" | "
+
+#: bytes: Translation table mapping each CR terminator to a line feed.
+TERMINATOR_TO_LINE_FEED = bytes.maketrans(TERMINATOR, LINE_FEED)
+
+#: re.Pattern: Reply sent by the laser for an unknown command.
+UNKNOWN_COMMAND = re.compile(b"!UK\n")
+
 
 class LuxxLaser(LaserBase):
+    #: dict: Compiled reply patterns, keyed by the 3-character command prefix.
+    _patterns = {}
+
+    #: dict: Compiled end-of-reply patterns, keyed by the 3-character command prefix.
+    _reply_ends = {}
+
+    #: dict: Operating mode code, keyed by mode name or code.
+    _mode_to_int = {
+        "Standby": 0,
+        0: 0,
+        "CW-ACC": 1,
+        1: 1,
+        "CW-APC": 2,
+        2: 2,
+        "Analog": 3,
+        3: 3,
+    }
+
+    #: dict: Operating mode name, keyed by mode code.
+    _int_to_mode = {0: "Standby", 1: "CW-ACC", 2: "CW-APC", 3: "Analog"}
+
+    #: dict: Pre-encoded set-mode frames, keyed by mode code.
+    _mode_commands = {
+        mode: COMMAND_PREFIX + b"ROM%i" % mode + TERMINATOR for mode in _int_to_mode
+    }
+
     def __init__(self, comport):
         """
         # Luxx Laser Class
@@ -27,33 +70,33 @@ class LuxxLaser(LaserBase):
         self.baudrate = 500000
         self.timeout = 0.3
 
+        #: dict: Last value written to each setting, used to skip redundant writes.
+        self._last_write = {}
+
         try:
             # Open serial port
             self.laser = serial.Serial(
                 self.comport, self.baudrate, timeout=self.timeout
             )
 
-            # Confirm the Laser Wavelength
-            # Must remove non-standard ASCII codes that cause errors in the utf-8 codec
-            wavelength = self.ask("GSI")
-            wavelength = wavelength.replace(b"\xa7200", str(" ").encode())
-            wavelength = wavelength.replace(b"\xa7140", str(" ").encode())
-            wavelength = float(wavelength.decode())
-            self.wavelength = wavelength
-
-            # Confirm the Laser Serial Number
-            serial_number = self.ask("GSN")
-            serial_number = serial_number.decode()
-            self.serial = serial_number
+            # Only the registers needed for control are read here.
+            # The remaining identification registers are read on first use.
 
-            # Confirm the Laser Working Hours
-            laser_working_hours = self.ask("GWH")
-            laser_working_hours = laser_working_hours.decode()
-            self.hours = laser_working_hours
+            # Confirm the Laser Firmware
+            firmware = self.ask("GFw")
+            self.firmware = firmware.decode() if firmware is not None else ""
 
             # Confirm the Laser Maximum Power
-            power_max = float(self.ask("GMP"))
-            self.pmax = power_max
+            power_max = self.ask("GMP")
+            if power_max is None:
+                self.laser.close()
+                raise OSError(
+                    f"Laser on port {self.comport} did not report its maximum power."
+                )
+            self.pmax = float(power_max)
+
+            #: float: Power in mW per step of the 12-bit power code.
+            self._power_scale = self.pmax / 4095.0
 
         except serial.SerialException:
             logger.error(f"{str(self)}, Could not open port {self.comport}")
@@ -63,6 +106,30 @@ class LuxxLaser(LaserBase):
                 + " port is specified or the port is already opened"
             )
 
+    @cached_property
+    def wavelength(self):
+        """
+        # Laser wavelength in nm, queried on first access.
+        # The reply also carries the nominal power after a separator, e.g.
+        # 488 | 200, so only the first field is kept.
+        """
+        wavelength = self.ask("GSI")
+        return float(wavelength.split(SEPARATOR_OUT)[0].decode())
+
+    @cached_property
+    def serial(self):
+        """
+        # Laser serial number, queried on first access.
+        """
+        return self.ask("GSN").decode()
+
+    @cached_property
+    def hours(self):
+        """
+        # Laser working hours, queried on first access.
+        """
+        return self.ask("GWH").decode()
+
     def __del__(self):
         """
         # Close the port before exit.
@@ -75,7 +142,7 @@ class LuxxLaser(LaserBase):
             self.laser.close()
 
         except serial.SerialException:
-            print("Could not close the port")
+            logger.error(f"Could not close the port {self.comport}")
 
     def close(self):
         """
@@ -85,22 +152,65 @@ class LuxxLaser(LaserBase):
             self.laser.close()
 
         except serial.SerialException:
-            print("could not close the port")
+            logger.error(f"Could not close the port {self.comport}")
 
     def write(self, command):
         """
         # Send *command* to device. Preceed it with "?" und end with CR.
         """
-        command = str("?").encode() + str(command).encode() + str("\r").encode()
-        self.laser.write(command)
-
-    def read(self):
-        """
-        # Read all information from the port and return it as string.
-        """
-        answer = self.laser.readall()
-        answer = answer.replace(str("\r").encode(), str("\n").encode())
-        answer = answer.replace(str("\xa7").encode(), str(" | ").encode())
+        self.send(COMMAND_PREFIX + str(command).encode() + TERMINATOR)
+
+    def send(self, frame):
+        """
+        # Write the encoded *frame* to the port.
+        # Unread bytes, e.g. the rest of an earlier multi-line reply, are
+        # discarded first, so they cannot be taken for the reply to *frame*.
+        """
+        self.laser.reset_input_buffer()
+        self.laser.write(frame)
+
+    def read(self, command):
+        """
+        # Read the reply to *command* from the port and return it as string.
+        # Stop reading as soon as the reply line for *command* (or !UK) has
+        # arrived rather than waiting for the timeout to elapse. Bytes that
+        # arrived with it, e.g. further lines of the reply, are kept.
+        """
+        answer = self.read_reply(command)
+        if self.laser.in_waiting:
+            answer += self.laser.read(self.laser.in_waiting)
+        return clean_reply(answer)
+
+    def read_reply(self, command):
+        """
+        # Read raw bytes until a complete reply line to *command* has arrived.
+        # Lines that belong to other commands do not end the read.
+        # On POSIX the port is polled with select, which wakes up as soon as
+        # bytes are available and then drains everything that is waiting,
+        # instead of pyserial's byte-by-byte read loop. Windows serial handles
+        # cannot be selected, so fall back to read_until there.
+        # Gives up after the port timeout if the reply is incomplete.
+        """
+        end = self.reply_end(command[:3])
+        answer = b""
+        if platform.system() == "Windows":
+            while end.search(answer) is None:
+                line = self.laser.read_until(TERMINATOR)
+                answer += line
+                if not line.endswith(TERMINATOR):
+                    # read_until timed out
+                    break
+            return answer
+
+        deadline = perf_counter() + self.timeout
+        while end.search(answer) is None:
+            remaining = deadline - perf_counter()
+            if remaining <= 0:
+                break
+            ready, _, _ = select.select([self.laser.fileno()], [], [], remaining)
+            if not ready:
+                break
+            answer += self.laser.read(self.laser.in_waiting or 1)
         return answer
 
     def ask(self, command):
@@ -110,27 +220,55 @@ class LuxxLaser(LaserBase):
         # !UK = Unknown command
         """
         self.write(command)
-        response = self.read()
-        search_string = str("!UK\n").encode()
-        if re.findall(search_string, response):
-            print("Command '%s' is unknown for this device" % command)
-        else:
-            search_string = "!%s(.+)\n" % command[:3]
-            search_string = search_string.encode()
-            print(f"The search string is: {search_string}")
-            print(f"The response string is: {response}")
+        return self.parse_reply(command, self.read(command))
 
-            if len(response) > 0:
-                response = re.findall(search_string, response)[-1]
+    def parse_reply(self, command, response):
+        """
+        # Extract the payload of the reply to *command* from *response*.
+        # Returns None for unknown commands, missing replies and error replies.
+        """
+        if UNKNOWN_COMMAND.search(response) is not None:
+            logger.warning("Command %r is unknown for this device", command)
+            return None
+
+        logger.debug("LuxX reply to %r: %r", command, response)
+        replies = self.reply_pattern(command[:3]).findall(response)
+        if not replies:
+            logger.warning("No valid reply from the laser to command %r", command)
+            return None
 
-            if response[0] == "x":
-                print("Laser responded with error to command '%s'" % command)
+        response = replies[-1]
+        if response[:1] == b"x":
+            logger.warning("Laser responded with error to command %r", command)
+            return None
+        return response
 
-            return response
+    @classmethod
+    def reply_pattern(cls, prefix):
+        """
+        # Return the compiled reply pattern for a 3-character command prefix.
+        # Patterns are compiled once and reused for every subsequent ask.
+        """
+        pattern = cls._patterns.get(prefix)
+        if pattern is None:
+            pattern = re.compile(b"!" + prefix.encode() + b"(.+)\n")
+            cls._patterns[prefix] = pattern
+        return pattern
+
+    @classmethod
+    def reply_end(cls, prefix):
+        """
+        # Return the compiled pattern of a complete raw reply line to a
+        # 3-character command prefix, or of the unknown command reply.
+        """
+        pattern = cls._reply_ends.get(prefix)
+        if pattern is None:
+            pattern = re.compile(b"!(?:%s|UK)[^\r]*\r" % re.escape(prefix.encode()))
+            cls._reply_ends[prefix] = pattern
+        return pattern
 
     def smart_ask(self, command):
         """
-        #  TODO: Not working.  Depends on broken print_hex function.
         Several commands return information coded in ASCII HEX numbers.
         The relevant are bits in the registers. For convenient
         representation, we will print(these bytes in tables.
@@ -150,33 +288,35 @@ class LuxxLaser(LaserBase):
         """
         # Start the emission (takes about 3 seconds)
         """
-        self.write("LOn")
+        self.ask("LOn")
 
     def stop(self):
         """
         # Stop the emission immediately
         """
-        self.write("LOf")
+        self.ask("LOf")
 
     def set_power(self, power):
         """
         Set the desired power in mW
-        TODO: Intermittent failure due to list index out of range in self.ask (line 115)
         """
         # Calculate the corresponding HEX code and transmit it
         if power > self.pmax:
-            print("Laser provides %imW only. The maximum power is set", self.pmax)
-            self.write("SLPFFF")
-        else:
-            code = hex(int(4095 * power / self.pmax))[2:].upper().zfill(3)
-            stopwatch(self.ask, "SLP%s" % code)
+            logger.warning(
+                f"Laser provides {self.pmax} mW only. The maximum power is set"
+            )
+            self._last_write.pop("power", None)
+            self.ask("SLPFFF")
+        elif self._last_write.get("power") != power:
+            code = format(int(4095 * power / self.pmax), "03X")
+            if self.ask("SLP" + code) is not None:
+                self._last_write["power"] = power
 
     def get_power(self):
         """
         # Get the current power value in mW
         """
-        code = stopwatch(self.ask, "GLP")
-        return int(code, 16) * self.pmax / 4095.0
+        return int(self.ask("GLP"), 16) * self._power_scale
 
     def set_mode(self, mode):
         """
@@ -194,46 +334,35 @@ class LuxxLaser(LaserBase):
         #      the output power is dependent on the analog input; however,
         #      it cannot exceed the specified with **set_power** value.
         """
-        if mode == "Standby" or mode == 0:
-            mode = 0
-        elif mode == "CW-ACC" or mode == 1:
-            mode = 1
-        elif mode == "CW-APC" or mode == 2:
-            mode = 2
-        elif mode == "Analog" or mode == 3:
-            mode = 3
-        else:
-            print(
+        mode = self._mode_to_int.get(mode)
+        if mode is None:
+            logger.warning(
                 "**mode** must be one of 'Standby', 'CW-ACC', "
                 + "'CW-APC', 'Analog' or number 0-3. Nothing changed."
             )
             return
-        stopwatch(self.ask, "ROM%i" % mode)
+        if self._last_write.get("mode") == mode:
+            return
+        self.send(self._mode_commands[mode])
+        if self.parse_reply("ROM", self.read("ROM")) is not None:
+            self._last_write["mode"] = mode
 
     def get_mode(self):
         """
         # Get the current mode.
         """
-        mode = int(stopwatch(self.ask, "ROM"))
-        if mode == 0:
-            return "Standby"
-        elif mode == 1:
-            return "CW-ACC"
-        elif mode == 2:
-            return "CW-APC"
-        elif mode == 3:
-            return "Analog"
-        else:
-            return mode
+        mode = int(self.ask("ROM"))
+        return self._int_to_mode.get(mode, mode)
 
     def set_autostart(self, state):
         """
         # Decide if light is emitted on powerup.
         """
-        if state:
-            self.ask("SAS1")
-        else:
-            self.ask("SAS0")
+        state = bool(state)
+        if self._last_write.get("autostart") == state:
+            return
+        if self.ask("SAS1" if state else "SAS0") is not None:
+            self._last_write["autostart"] = state
 
     def get_autostart(self):
         """
@@ -290,19 +419,33 @@ class LuxxLaser(LaserBase):
         self.set_mode("CW-APC")
         self.start()
 
+
+def clean_reply(answer):
+    """
+    # Convert a raw reply to newline-terminated, printable bytes.
+    """
+    return answer.translate(TERMINATOR_TO_LINE_FEED).replace(
+        SEPARATOR_IN, SEPARATOR_OUT
+    )
+
+
 def stopwatch(func, *func_args, **func_kwargs):
     """
-    # Call **func** and print elapsed time
+    # Call **func** and log the elapsed time at debug level.
+    # Opt-in profiling helper; the laser control methods do not use it.
     """
-    # start_time = time()
+    start_time = perf_counter()
     result = func(*func_args, **func_kwargs)
-    # print("Time elapsed: %5.2f ms" % ((time() - start_time)*1000.0))
+    logger.debug(
+        "%s elapsed: %5.2f ms",
+        getattr(func, "__name__", func),
+        (perf_counter() - start_time) * 1000.0,
+    )
     return result
 
 
 def print_hex(hex_code):
     """
-    TODO: Not working.  Concatenation of list and range?
     print a nice table that represents *hex_code* (ASCII HEX string)
     in a binary code.
 
@@ -310,21 +453,15 @@ def print_hex(hex_code):
     -------
     corresponding decimal numbers in array
     """
+    if isinstance(hex_code, bytes):
+        hex_code = hex_code.decode()
+
     # If the number is odd, pad it with leading zero
-    length = len(hex_code)
-    byte_number = (length / 2) + (length % 2)
-    if length % 2:
+    if len(hex_code) % 2:
         hex_code = "0" + hex_code
 
-    # Split it into 8-bit numbers coded in ASCII HEX
-    hex_numbers = []
-    for i in range(int(byte_number)):
-        hex_numbers.append(hex_code[i * 2 : i * 2 + 2])
-
-    # Convert each of them into decimal
-    decimals = []
-    for hex_number in hex_numbers:
-        decimals.append(int(hex_number, 16))
+    # Split it into 8-bit numbers and convert each of them into decimal
+    decimals = list(bytes.fromhex(hex_code))
 
     # print a table
     table = """BYTE ##  :  '?'
@@ -338,13 +475,10 @@ def print_hex(hex_code):
     for i, number in enumerate(decimals):
         byte = len(decimals) - i - 1
 
-        # data_range is type Range
-        data_range = range(byte * 8, byte * 8 + 8)[::-1]
-
-        # data_list is type list
-        data_list = list(bin(number)[2:].zfill(8))
-        print("data list:", data_list)
+        # Bit numbers, most significant first, and the matching bit values
+        bit_numbers = list(range(byte * 8 + 7, byte * 8 - 1, -1))
+        bits = [(number >> (7 - k)) & 1 for k in range(8)]
 
-        content = data_range + data_list
-        print(table % tuple([byte, hex_numbers[i]] + content))
+        content = bit_numbers + bits
+        print(table % tuple([byte, hex_code[i * 2 : i * 2 + 2]] + content))
     return decimals
@@ -9,13 +9,23 @@ Tested on Thorlabs KIM001.
 import ctypes
 import ctypes.wintypes
 from enum import IntEnum
+from functools import lru_cache
 
 CODING = "ascii"
 
-__dll = ctypes.WinDLL(
+DLL_PATH = (
     "C:\Program Files\Thorlabs\Kinesis\Thorlabs.MotionControl.KCube.InertialMotor.dll"
 )
 
+#: ctypes.WinDLL: Handle to the Kinesis DLL, loaded on first use.
+_DLL = None
+
+#: int: Length of the buffer the device list functions write serial numbers to.
+_LIST_BUF_LEN = 256
+
+#: ctypes.Array: Buffer reused by the device list functions.
+_LIST_BUF = ctypes.create_string_buffer(_LIST_BUF_LEN)
+
 
 class TLFTDICommunicationError(Exception):
     """Exception for Thorlabs FTDI communications module or supporting code."""
@@ -145,9 +155,33 @@ Motor_DLL_Error_Description = {
 }
 
 
-def in_enum(value, enum):
-    values = set(item.value for item in enum)
-    return value in values
+#: dict: Exception class and description for each error code, used by errcheck.
+_ERR_TABLE = {
+    int(code): (error, description)
+    for error, descriptions in (
+        (TLFTDICommunicationError, FT_Status_Description),
+        (TLDLLError, TL_DLL_Error_Description),
+        (TLMotorDLLError, Motor_DLL_Error_Description),
+    )
+    for code, description in descriptions.items()
+}
+
+
+@lru_cache(maxsize=32)
+def _enc(serial_no):
+    """Encode a serial number for the DLL, caching the result.
+
+    Parameters
+    ----------
+    serial_no : str
+        Serial number of Thorlabs Kinesis Inertial Motor (KIM) device.
+
+    Returns
+    -------
+    bytes
+        The encoded serial number.
+    """
+    return serial_no.encode(CODING)
 
 
 def errcheck(result, func, args):
@@ -170,19 +204,76 @@ def errcheck(result, func, args):
     """
     if result:
         # returned a non-zero value
-        if in_enum(result, FT_Status):
-            raise TLFTDICommunicationError(FT_Status_Description[result])
-        elif in_enum(result, TL_DLL_Error):
-            raise TLDLLError(TL_DLL_Error_Description[result])
-        elif in_enum(result, Motor_DLL_Error):
-            raise TLMotorDLLError(Motor_DLL_Error_Description[result])
-        else:
-            raise Exception(f"Unknown error {result} in Thorlabs device.")
+        error, description = _ERR_TABLE.get(
+            result, (Exception, f"Unknown error {result} in Thorlabs device.")
+        )
+        raise error(description)
     return int(result)
 
 
-__dll.TLI_BuildDeviceList.restype = ctypes.c_short
-__dll.TLI_BuildDeviceList.errcheck = errcheck
+def _get_dll():
+    """Load the Kinesis DLL and bind its function prototypes on first use.
+
+    Returns
+    -------
+    ctypes.WinDLL
+        The loaded DLL.
+    """
+    global _DLL
+    if _DLL is None:
+        dll = ctypes.WinDLL(DLL_PATH)
+        _bind_prototypes(dll)
+        _DLL = dll
+    return _DLL
+
+
+def _bind_prototypes(dll):
+    """Set the argument and return types of the DLL functions used here.
+
+    Parameters
+    ----------
+    dll : ctypes.WinDLL
+        The loaded DLL.
+    """
+    dll.TLI_BuildDeviceList.restype = ctypes.c_short
+    dll.TLI_BuildDeviceList.errcheck = errcheck
+    dll.TLI_GetDeviceListSize.restype = ctypes.c_short
+    dll.TLI_GetDeviceListExt.argtypes = [ctypes.c_char_p, ctypes.wintypes.DWORD]
+    dll.TLI_GetDeviceListExt.restype = ctypes.c_short
+    dll.TLI_GetDeviceListExt.errcheck = errcheck
+    dll.TLI_GetDeviceListByTypeExt.argtypes = [
+        ctypes.c_char_p,
+        ctypes.wintypes.DWORD,
+        ctypes.c_int,
+    ]
+    dll.TLI_GetDeviceListByTypeExt.restype = ctypes.c_short
+    dll.TLI_GetDeviceListByTypeExt.errcheck = errcheck
+    dll.TLI_GetDeviceInfo.argtypes = [ctypes.c_char_p, ctypes.POINTER(TLI_DeviceInfo)]
+    dll.TLI_GetDeviceInfo.restype = ctypes.c_short
+    dll.KIM_Open.argtypes = [ctypes.c_char_p]
+    dll.KIM_Open.restype = ctypes.c_short
+    dll.KIM_Open.errcheck = errcheck
+    dll.KIM_Close.argtypes = [ctypes.c_char_p]
+    dll.KIM_StartPolling.argtypes = [ctypes.c_char_p, ctypes.c_int]
+    dll.KIM_StartPolling.restype = ctypes.wintypes.BOOL
+    dll.KIM_StopPolling.argtypes = [ctypes.c_char_p]
+    dll.KIM_RequestCurrentPosition.argtypes = [ctypes.c_char_p, ctypes.c_ushort]
+    dll.KIM_RequestCurrentPosition.restype = ctypes.c_int
+    dll.KIM_RequestCurrentPosition.errcheck = errcheck
+    dll.KIM_GetCurrentPosition.argtypes = [ctypes.c_char_p, ctypes.c_ushort]
+    dll.KIM_GetCurrentPosition.restype = ctypes.c_int
+    dll.KIM_MoveAbsolute.argtypes = [ctypes.c_char_p, ctypes.c_ushort, ctypes.c_int]
+    dll.KIM_MoveAbsolute.restype = ctypes.c_short
+    dll.KIM_MoveAbsolute.errcheck = errcheck
+    dll.KIM_SetPosition.argtypes = [ctypes.c_char_p, ctypes.c_ushort, ctypes.c_long]
+    dll.KIM_SetPosition.restype = ctypes.c_short
+    dll.KIM_SetPosition.errcheck = errcheck
+    dll.KIM_MoveJog.argtypes = [ctypes.c_char_p, ctypes.c_ushort, ctypes.c_byte]
+    dll.KIM_MoveJog.restype = ctypes.c_short
+    dll.KIM_MoveJog.errcheck = errcheck
+    dll.KIM_MoveStop.argtypes = [ctypes.c_char_p, ctypes.c_ushort]
+    dll.KIM_MoveStop.restype = ctypes.c_short
+    dll.KIM_MoveStop.errcheck = errcheck
 
 
 def TLI_BuildDeviceList():
@@ -194,10 +285,7 @@ def TLI_BuildDeviceList():
     int
         The error code or 0 if successful.
     """
-    return __dll.TLI_BuildDeviceList()
-
-
-__dll.TLI_GetDeviceListSize.restype = ctypes.c_short
+    return _get_dll().TLI_BuildDeviceList()
 
 
 def TLI_GetDeviceListSize():
@@ -209,12 +297,7 @@ def TLI_GetDeviceListSize():
     int
         Number of devices in device list.
     """
-    return __dll.TLI_GetDeviceListSize()
-
-
-__dll.TLI_GetDeviceListExt.argtypes = [ctypes.c_char_p, ctypes.wintypes.DWORD]
-__dll.TLI_GetDeviceListExt.restype = ctypes.c_short
-__dll.TLI_GetDeviceListExt.errcheck = errcheck
+    return _get_dll().TLI_GetDeviceListSize()
 
 
 def TLI_GetDeviceListExt():
@@ -226,20 +309,10 @@ def TLI_GetDeviceListExt():
         List of device serial numbers as strings.
     """
 
-    c_buf_len = 256
-    c_buf = ctypes.create_string_buffer(c_buf_len)
-    __dll.TLI_GetDeviceListExt(c_buf, c_buf_len)
-
-    return str(c_buf.value.decode(CODING)).split(",")[:-1]
+    ctypes.memset(_LIST_BUF, 0, _LIST_BUF_LEN)
+    _get_dll().TLI_GetDeviceListExt(_LIST_BUF, _LIST_BUF_LEN)
 
-
-__dll.TLI_GetDeviceListByTypeExt.argtypes = [
-    ctypes.c_char_p,
-    ctypes.wintypes.DWORD,
-    ctypes.c_int,
-]
-__dll.TLI_GetDeviceListByTypeExt.restype = ctypes.c_short
-__dll.TLI_GetDeviceListByTypeExt.errcheck = errcheck
+    return str(_LIST_BUF.value.decode(CODING)).split(",")[:-1]
 
 
 def TLI_GetDeviceListByTypeExt(type_id):
@@ -256,11 +329,10 @@ def TLI_GetDeviceListByTypeExt(type_id):
         List of device serial numbers as strings.
     """
 
-    c_buf_len = 256
-    c_buf = ctypes.create_string_buffer(c_buf_len)
-    __dll.TLI_GetDeviceListByTypeExt(c_buf, c_buf_len, type_id)
+    ctypes.memset(_LIST_BUF, 0, _LIST_BUF_LEN)
+    _get_dll().TLI_GetDeviceListByTypeExt(_LIST_BUF, _LIST_BUF_LEN, type_id)
 
-    return str(c_buf.value.decode(CODING)).split(",")[:-1]
+    return str(_LIST_BUF.value.decode(CODING)).split(",")[:-1]
 
 
 class MOT_MotorTypes(IntEnum):
@@ -301,10 +373,6 @@ class TLI_DeviceInfo(ctypes.Structure):
     ]
 
 
-__dll.TLI_GetDeviceInfo.argtypes = [ctypes.c_char_p, ctypes.POINTER(TLI_DeviceInfo)]
-__dll.TLI_GetDeviceInfo.restype = ctypes.c_short
-
-
 def TLI_GetDeviceInfo(serial_no):
     """Get the device information from the USB port.
 
@@ -323,18 +391,13 @@ def TLI_GetDeviceInfo(serial_no):
 
     info = TLI_DeviceInfo()
 
-    __dll.TLI_GetDeviceInfo(
-        serial_no.encode(CODING), ctypes.byref(info)
+    _get_dll().TLI_GetDeviceInfo(
+        _enc(serial_no), ctypes.byref(info)
     )  # 1 if successful, 0 if not
 
     return info
 
 
-__dll.KIM_Open.argtypes = [ctypes.c_char_p]
-__dll.KIM_Open.restype = ctypes.c_short
-__dll.KIM_Open.errcheck = errcheck
-
-
 def KIM_Open(serial_no):
     """Open the device for communications.
 
@@ -349,10 +412,7 @@ def KIM_Open(serial_no):
         The error code or 0 if successful.
     """
 
-    return __dll.KIM_Open(serial_no.encode(CODING))
-
-
-__dll.KIM_Close.argtypes = [ctypes.c_char_p]
+    return _get_dll().KIM_Open(_enc(serial_no))
 
 
 def KIM_Close(serial_no):
@@ -368,11 +428,7 @@ def KIM_Close(serial_no):
     None
     """
 
-    __dll.KIM_Close(serial_no.encode(CODING))
-
-
-__dll.KIM_StartPolling.argtypes = [ctypes.c_char_p, ctypes.c_int]
-__dll.KIM_StartPolling.restype = ctypes.wintypes.BOOL
+    _get_dll().KIM_Close(_enc(serial_no))
 
 
 def KIM_StartPolling(serial_no, milliseconds):
@@ -390,10 +446,7 @@ def KIM_StartPolling(serial_no, milliseconds):
     bool
         True if successful, False otherwise
     """
-    return bool(__dll.KIM_StartPolling(serial_no.encode(CODING), milliseconds))
-
-
-__dll.KIM_StopPolling.argtypes = [ctypes.c_char_p]
+    return bool(_get_dll().KIM_StartPolling(_enc(serial_no), milliseconds))
 
 
 def KIM_StopPolling(serial_no):
@@ -408,7 +461,7 @@ def KIM_StopPolling(serial_no):
     -------
     None
     """
-    __dll.KIM_StopPolling(serial_no.encode(CODING))
+    _get_dll().KIM_StopPolling(_enc(serial_no))
 
 
 class KIM_Channels(IntEnum):  # unsigned short
@@ -418,11 +471,6 @@ class KIM_Channels(IntEnum):  # unsigned short
     Channel4 = 4
 
 
-__dll.KIM_RequestCurrentPosition.argtypes = [ctypes.c_char_p, ctypes.c_ushort]
-__dll.KIM_RequestCurrentPosition.restype = ctypes.c_int
-__dll.KIM_RequestCurrentPosition.errcheck = errcheck
-
-
 def KIM_RequestCurrentPosition(serial_no, channel):
     """Gets current position.
 
@@ -439,11 +487,7 @@ def KIM_RequestCurrentPosition(serial_no, channel):
         The error code or 0 if successful.
     """
 
-    return __dll.KIM_RequestCurrentPosition(serial_no.encode(CODING), channel)
-
-
-__dll.KIM_GetCurrentPosition.argtypes = [ctypes.c_char_p, ctypes.c_ushort]
-__dll.KIM_GetCurrentPosition.restype = ctypes.c_int
+    return _get_dll().KIM_RequestCurrentPosition(_enc(serial_no), channel)
 
 
 def KIM_GetCurrentPosition(serial_no, channel):
@@ -462,12 +506,7 @@ def KIM_GetCurrentPosition(serial_no, channel):
         Current position.
     """
 
-    return __dll.KIM_GetCurrentPosition(serial_no.encode(CODING), channel)
-
-
-__dll.KIM_MoveAbsolute.argtypes = [ctypes.c_char_p, ctypes.c_ushort, ctypes.c_int]
-__dll.KIM_MoveAbsolute.restype = ctypes.c_short
-__dll.KIM_MoveAbsolute.errcheck = errcheck
+    return _get_dll().KIM_GetCurrentPosition(_enc(serial_no), channel)
 
 
 def KIM_MoveAbsolute(serial_no, channel, position):
@@ -488,12 +527,7 @@ def KIM_MoveAbsolute(serial_no, channel, position):
         The error code or 0 if successful.
     """
 
-    return __dll.KIM_MoveAbsolute(serial_no.encode(CODING), channel, position)
-
-
-__dll.KIM_SetPosition.argtypes = [ctypes.c_char_p, ctypes.c_ushort, ctypes.c_long]
-__dll.KIM_SetPosition.restype = ctypes.c_short
-__dll.KIM_SetPosition.errcheck = errcheck
+    return _get_dll().KIM_MoveAbsolute(_enc(serial_no), channel, position)
 
 
 def KIM_SetPosition(serial_no, channel, position):
@@ -514,7 +548,7 @@ def KIM_SetPosition(serial_no, channel, position):
         The error code or 0 if successful.
     """
 
-    return __dll.KIM_SetPosition(serial_no.encode(CODING), channel, position)
+    return _get_dll().KIM_SetPosition(_enc(serial_no), channel, position)
 
 
 class KIM_TravelDirection(IntEnum):  # byte
@@ -522,11 +556,6 @@ class KIM_TravelDirection(IntEnum):  # byte
     Reverse = 2  # An enum constant representing the reverse option.
 
 
-__dll.KIM_MoveJog.argtypes = [ctypes.c_char_p, ctypes.c_ushort, ctypes.c_byte]
-__dll.KIM_MoveJog.restype = ctypes.c_short
-__dll.KIM_MoveJog.errcheck = errcheck
-
-
 def KIM_MoveJog(serial_no, channel, jog_direction):
     """Move jog.
 
@@ -545,12 +574,7 @@ def KIM_MoveJog(serial_no, channel, jog_direction):
         The error code or 0 if successful.
     """
 
-    return __dll.KIM_MoveJog(serial_no.encode(CODING), channel, jog_direction)
-
-
-__dll.KIM_MoveStop.argtypes = [ctypes.c_char_p, ctypes.c_ushort]
-__dll.KIM_MoveStop.restype = ctypes.c_short
-__dll.KIM_MoveAbsolute.errcheck = errcheck
+    return _get_dll().KIM_MoveJog(_enc(serial_no), channel, jog_direction)
 
 
 def KIM_MoveStop(serial_no, channel):
@@ -569,4 +593,4 @@ def KIM_MoveStop(serial_no, channel):
         The error code or 0 if successful.
     """
 
-    return __dll.KIM_MoveStop(serial_no.encode(CODING), channel)
+    return _get_dll().KIM_MoveStop(_enc(serial_no), channel)
@@ -508,9 +508,9 @@ class PhotometricsBase(CameraBase):
             frame, fps, frame_count = self.camera_controller.poll_frame(
                 timeout_ms=10000
             )
-            self._data_buffer[self._frames_received][:, :] = np.copy(
-                frame["pixel_data"][:]
-            )
+            # Copy straight into the preallocated buffer, without an
+            # intermediate frame-sized array.
+            np.copyto(self._data_buffer[self._frames_received], frame["pixel_data"])
             # Delete copied frame for memory management
             frame = None
             del frame
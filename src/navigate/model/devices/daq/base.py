@@ -131,10 +131,8 @@ class DAQBase:
         microscope_state = self.configuration["experiment"]["MicroscopeState"]
 
         # Iterate through the dictionary.
-        for channel_key in microscope_state["channels"].keys():
+        for channel_key, channel in microscope_state["channels"].items():
             # channel includes 'is_selected', 'laser', 'filter', 'camera_exposure'...
-            channel = microscope_state["channels"][channel_key]
-
             # Only proceed if it is enabled in the GUI
             if channel["is_selected"] is True:
                 exposure_time = exposure_times[channel_key]
@@ -76,9 +76,15 @@ class NIDAQ(DAQBase):
         #: obj: NI DAQmx task for master trigger
         self.master_trigger_task = None
 
+        #: str: Master trigger output line the master trigger task was created for.
+        self.master_trigger_out_line = None
+
         #: obj: NI DAQmx task for laser switching
         self.laser_switching_task = None
 
+        #: str: Port the laser switching task was created for.
+        self.laser_switching_port = None
+
         #: str: Trigger mode. Self-trigger or external-trigger.
         self.trigger_mode = "self-trigger"  # self-trigger, external-trigger
 
@@ -92,6 +98,9 @@ class NIDAQ(DAQBase):
         #: dict: NI DAQmx tasks for analog output.
         self.analog_output_tasks = {}
 
+        #: dict: Reusable per-board arrays holding the samples written to each task.
+        self.analog_output_buffers = {}
+
         #: float: Number of samples.
         self.n_sample = None
 
@@ -112,6 +121,7 @@ class NIDAQ(DAQBase):
         """Destructor."""
         if self.camera_trigger_task is not None:
             self.stop_acquisition()
+        self.close_master_trigger_task()
 
     def set_external_trigger(self, external_trigger=None) -> None:
         """Set trigger mode.
@@ -164,17 +174,7 @@ class NIDAQ(DAQBase):
                         f"Error Registering Done Event: {traceback.format_exc()}"
                     )
         else:
-            # close master trigger task
-            if self.master_trigger_task:
-                try:
-                    self.master_trigger_task.stop()
-                    self.master_trigger_task.close()
-                except Exception:
-                    logger.debug(
-                        f"Error stopping master trigger task: "
-                        f"{traceback.format_exc()}"
-                    )
-            self.master_trigger_task = None
+            self.close_master_trigger_task()
             # camera task trigger source
             self.camera_trigger_task.triggers.start_trigger.cfg_dig_edge_start_trig(
                 self.external_trigger
@@ -311,15 +311,38 @@ class NIDAQ(DAQBase):
         )
 
     def create_master_trigger_task(self) -> None:
-        """Set up the DO master trigger task."""
-        self.master_trigger_task = nidaqmx.Task()
+        """Set up the DO master trigger task.
+
+        The task is kept across acquisitions and only recreated when the master
+        trigger line changes.
+        """
         master_trigger_out_line = self.configuration["configuration"]["microscopes"][
             self.microscope_name
         ]["daq"]["master_trigger_out_line"]
+        if self.master_trigger_task is not None:
+            if self.master_trigger_out_line == master_trigger_out_line:
+                return
+            self.close_master_trigger_task()
+
+        self.master_trigger_task = nidaqmx.Task()
         self.master_trigger_task.do_channels.add_do_chan(
             master_trigger_out_line,
             line_grouping=nidaqmx.constants.LineGrouping.CHAN_FOR_ALL_LINES,
         )
+        self.master_trigger_out_line = master_trigger_out_line
+
+    def close_master_trigger_task(self) -> None:
+        """Stop and close the DO master trigger task, if there is one."""
+        if self.master_trigger_task:
+            try:
+                self.master_trigger_task.stop()
+                self.master_trigger_task.close()
+            except Exception:
+                logger.debug(
+                    f"Error stopping master trigger task: {traceback.format_exc()}"
+                )
+        self.master_trigger_task = None
+        self.master_trigger_out_line = None
 
     def create_analog_output_tasks(self, channel_key: str) -> None:
         """Create analog output tasks for each board.
@@ -369,23 +392,68 @@ class NIDAQ(DAQBase):
             # )
             # TODO: may change this later to automatically expand the waveform to the
             #  longest
-            for k, v in self.analog_outputs.items():
-                if (
-                    k.split("/")[0] == board
-                    and len(v["waveform"][channel_key]) < max_sample
-                ):
-                    v["waveform"][channel_key] = np.hstack(
-                        [v["waveform"][channel_key]] * self.waveform_expand_num
-                    )
             # Write values to board
-            waveforms = np.vstack(
-                [
-                    v["waveform"][channel_key][:max_sample]
-                    for k, v in self.analog_outputs.items()
-                    if k.split("/")[0] == board
-                ]
-            ).squeeze()
-            self.analog_output_tasks[board].write(waveforms)
+            self.analog_output_tasks[board].write(
+                self.fill_analog_output_buffer(
+                    board, channel_key, max_sample, expand=True
+                )
+            )
+
+    def fill_analog_output_buffer(
+        self, board: str, channel_key: str, n_samples: int, expand: bool = False
+    ) -> np.ndarray:
+        """Copy the waveforms of a board's channels into its output buffer.
+
+        The buffer is only reallocated when the number of channels or samples
+        changes, otherwise it is overwritten in place. It is kept as C-contiguous
+        float64, the layout nidaqmx writes from, so the task can use it without
+        making its own converted copy.
+
+        When expanding, waveforms shorter than n_samples are repeated
+        waveform_expand_num times directly into the buffer rather than being
+        concatenated into a new array first.
+
+        Parameters
+        ----------
+        board : str
+            Name of the board.
+        channel_key : str
+            Channel key for analog output.
+        n_samples : int
+            Maximum number of samples to write per analog channel.
+        expand : bool
+            Repeat short waveforms waveform_expand_num times. Default is False.
+
+        Returns
+        -------
+        np.ndarray
+            Writeable, C-contiguous float64 waveforms for the board, one row per
+            analog channel, squeezed to 1D for a single channel.
+        """
+        waveforms = [
+            v["waveform"][channel_key]
+            for k, v in self.analog_outputs.items()
+            if k.split("/")[0] == board
+        ]
+        lengths = [
+            min(len(waveform) * self.waveform_expand_num, n_samples)
+            if expand and len(waveform) < n_samples
+            else min(len(waveform), n_samples)
+            for waveform in waveforms
+        ]
+        shape = (len(waveforms), lengths[0])
+        buffer = self.analog_output_buffers.get(board)
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, dtype=np.float64, order="C")
+            self.analog_output_buffers[board] = buffer
+        for row, waveform, length in zip(buffer, waveforms, lengths):
+            if length != shape[1]:
+                raise ValueError(
+                    f"Analog waveforms on {board} have different lengths: {lengths}"
+                )
+            for start in range(0, length, len(waveform)):
+                row[start : start + len(waveform)] = waveform[: length - start]
+        return buffer.squeeze()
 
     def prepare_acquisition(self, channel_key: str) -> None:
         """Prepare the acquisition.
@@ -473,9 +541,9 @@ class NIDAQ(DAQBase):
             self.camera_trigger_task.stop()
             self.camera_trigger_task.close()
 
+            # the master trigger task is reused by the next acquisition
             if self.trigger_mode == "self-trigger":
                 self.master_trigger_task.stop()
-                self.master_trigger_task.close()
 
             for k, task in self.analog_output_tasks.items():
                 task.stop()
@@ -501,6 +569,7 @@ class NIDAQ(DAQBase):
             self.microscope_name = microscope_name
             self.analog_outputs = {}
             self.analog_output_tasks = {}
+            self.close_master_trigger_task()
 
         self.camera_delay = (
             float(self.waveform_constants["other_constants"].get("camera_delay", 5))
@@ -518,13 +587,21 @@ class NIDAQ(DAQBase):
                 self.microscope_name
             ]["daq"]["laser_switch_state"]
 
-            if self.laser_switching_task:
+            # this runs on every waveform update, so only recreate the task
+            # when the switching port changes
+            if (
+                self.laser_switching_task
+                and switching_port != self.laser_switching_port
+            ):
                 self.laser_switching_task.close()
-            self.laser_switching_task = nidaqmx.Task()
-            self.laser_switching_task.do_channels.add_do_chan(
-                switching_port,
-                line_grouping=nidaqmx.constants.LineGrouping.CHAN_FOR_ALL_LINES,
-            )
+                self.laser_switching_task = None
+            if self.laser_switching_task is None:
+                self.laser_switching_task = nidaqmx.Task()
+                self.laser_switching_task.do_channels.add_do_chan(
+                    switching_port,
+                    line_grouping=nidaqmx.constants.LineGrouping.CHAN_FOR_ALL_LINES,
+                )
+                self.laser_switching_port = switching_port
             self.laser_switching_task.write(switching_on_state, auto_start=True)
         except KeyError:
             pass
@@ -563,14 +640,11 @@ class NIDAQ(DAQBase):
             self.analog_output_tasks[board_name].stop()
 
             # Write values to board
-            waveforms = np.vstack(
-                [
-                    v["waveform"][self.current_channel_key][: self.n_sample]
-                    for k, v in self.analog_outputs.items()
-                    if k.split("/")[0] == board_name
-                ]
-            ).squeeze()
-            self.analog_output_tasks[board_name].write(waveforms)
+            self.analog_output_tasks[board_name].write(
+                self.fill_analog_output_buffer(
+                    board_name, self.current_channel_key, self.n_sample
+                )
+            )
         except Exception:
             logger.debug(f"Could not update analog task: {traceback.format_exc()}")
             for board in self.analog_output_tasks.keys():
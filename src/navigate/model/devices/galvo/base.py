@@ -35,6 +35,7 @@ import logging
 from typing import Any, Dict
 
 # Third Party Imports
+import numpy as np
 
 # Local Imports
 from navigate.model.waveforms import sawtooth, sine_wave
@@ -154,10 +155,8 @@ class GalvoBase:
             self.microscope_name
         ]["daq"]["sample_rate"]
 
-        for channel_key in microscope_state["channels"].keys():
+        for channel_key, channel in microscope_state["channels"].items():
             # channel includes 'is_selected', 'laser', 'filter', 'camera_exposure'...
-            channel = microscope_state["channels"][channel_key]
-
             # Only proceed if it is enabled in the GUI
             if channel["is_selected"] is True:
 
@@ -232,12 +231,12 @@ class GalvoBase:
                     print("Unknown Galvo waveform specified in configuration file.")
                     self.waveform_dict[channel_key] = None
                     continue
-                self.waveform_dict[channel_key][
-                    self.waveform_dict[channel_key] > self.galvo_max_voltage
-                ] = self.galvo_max_voltage
-                self.waveform_dict[channel_key][
-                    self.waveform_dict[channel_key] < self.galvo_min_voltage
-                ] = self.galvo_min_voltage
+                np.clip(
+                    self.waveform_dict[channel_key],
+                    self.galvo_min_voltage,
+                    self.galvo_max_voltage,
+                    out=self.waveform_dict[channel_key],
+                )
 
         return self.waveform_dict
 
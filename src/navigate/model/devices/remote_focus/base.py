@@ -35,6 +35,7 @@ import logging
 from typing import Any, Dict
 
 # Third Party Imports
+import numpy as np
 
 # Local Imports
 from navigate.model.waveforms import (
@@ -166,10 +167,12 @@ class RemoteFocusBase:
             waveform_constants["other_constants"]["percent_smoothing"]
         )
 
-        for channel_key in microscope_state["channels"].keys():
-            # channel includes 'is_selected', 'laser', 'filter', 'camera_exposure'...
-            channel = microscope_state["channels"][channel_key]
+        # Remote focus constants for the current microscope and zoom, keyed by
+        # laser. Looked up on the first selected channel.
+        zoom_constants = None
 
+        for channel_key, channel in microscope_state["channels"].items():
+            # channel includes 'is_selected', 'laser', 'filter', 'camera_exposure'...
             # Only proceed if it is enabled in the GUI
             if channel["is_selected"] is True:
 
@@ -182,34 +185,19 @@ class RemoteFocusBase:
                 samples = int(self.sample_rate * self.sweep_time)
 
                 # Remote Focus Parameters
-                temp = waveform_constants["remote_focus_constants"][imaging_mode][zoom][
-                    laser
-                ]["amplitude"]
-                if temp == "-" or temp == ".":
-                    waveform_constants["remote_focus_constants"][imaging_mode][zoom][
-                        laser
-                    ]["amplitude"] = "0"
-
-                remote_focus_amplitude = float(
-                    waveform_constants["remote_focus_constants"][imaging_mode][zoom][
-                        laser
-                    ]["amplitude"]
-                )
+                if zoom_constants is None:
+                    zoom_constants = waveform_constants["remote_focus_constants"][
+                        imaging_mode
+                    ][zoom]
+                laser_constants = zoom_constants[laser]
 
                 # Validation for when user puts a '-' in spinbox
-                temp = waveform_constants["remote_focus_constants"][imaging_mode][zoom][
-                    laser
-                ]["offset"]
-                if temp == "-" or temp == ".":
-                    waveform_constants["remote_focus_constants"][imaging_mode][zoom][
-                        laser
-                    ]["offset"] = "0"
-
-                remote_focus_offset = float(
-                    waveform_constants["remote_focus_constants"][imaging_mode][zoom][
-                        laser
-                    ]["offset"]
-                )
+                for key in ("amplitude", "offset"):
+                    if laser_constants[key] in ("-", "."):
+                        laser_constants[key] = "0"
+
+                remote_focus_amplitude = float(laser_constants["amplitude"])
+                remote_focus_offset = float(laser_constants["offset"])
                 if offset is not None:
                     remote_focus_offset += offset
 
@@ -249,11 +237,11 @@ class RemoteFocusBase:
                     )[:samples]
 
                 # Clip any values outside the hardware limits
-                self.waveform_dict[channel_key][
-                    self.waveform_dict[channel_key] > self.remote_focus_max_voltage
-                ] = self.remote_focus_max_voltage
-                self.waveform_dict[channel_key][
-                    self.waveform_dict[channel_key] < self.remote_focus_min_voltage
-                ] = self.remote_focus_min_voltage
+                np.clip(
+                    self.waveform_dict[channel_key],
+                    self.remote_focus_min_voltage,
+                    self.remote_focus_max_voltage,
+                    out=self.waveform_dict[channel_key],
+                )
 
         return self.waveform_dict
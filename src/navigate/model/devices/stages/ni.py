@@ -190,10 +190,8 @@ class GalvoNIStage(StageBase):
         self.switch_mode("waveform")
         microscope_state = self.configuration["experiment"]["MicroscopeState"]
 
-        for channel_key in microscope_state["channels"].keys():
+        for channel_key, channel in microscope_state["channels"].items():
             # channel includes 'is_selected', 'laser', 'filter', 'camera_exposure'...
-            channel = microscope_state["channels"][channel_key]
-
             # Only proceed if it is enabled in the GUI
             if channel["is_selected"] is True:
 
@@ -202,12 +200,12 @@ class GalvoNIStage(StageBase):
                     print("*** updating waveform in StageGalvo failed!", channel_key)
                     return False
 
-                waveform_dict[channel_key][
-                    waveform_dict[channel_key] > self.galvo_max_voltage
-                ] = self.galvo_max_voltage
-                waveform_dict[channel_key][
-                    waveform_dict[channel_key] < self.galvo_min_voltage
-                ] = self.galvo_min_voltage
+                np.clip(
+                    waveform_dict[channel_key],
+                    self.galvo_min_voltage,
+                    self.galvo_max_voltage,
+                    out=waveform_dict[channel_key],
+                )
 
         self.waveform_dict = waveform_dict
         self.daq.analog_outputs[self.axes_channels[0]] = {
@@ -142,17 +142,26 @@ class TLKIMStage(StageBase):
         position_dict : dict
             Dictionary containing the current position of the stage.
         """
+        errors = (
+            self.kim_controller.TLFTDICommunicationError,
+            self.kim_controller.TLDLLError,
+            self.kim_controller.TLMotorDLLError,
+        )
+        # need to request before we get the current position. Request every
+        # channel first so the replies arrive while the others are requested.
+        requested = {}
         for ax, i in self.axes_mapping.items():
             try:
-                # need to request before we get the current position
                 self.kim_controller.KIM_RequestCurrentPosition(self.serial_number, i)
+                requested[ax] = i
+            except errors:
+                pass
+
+        for ax, i in requested.items():
+            try:
                 pos = self.kim_controller.KIM_GetCurrentPosition(self.serial_number, i)
                 setattr(self, f"{ax}_pos", pos)
-            except (
-                self.kim_controller.TLFTDICommunicationError,
-                self.kim_controller.TLDLLError,
-                self.kim_controller.TLMotorDLLError,
-            ):
+            except errors:
                 pass
 
         return self.get_position_dict()
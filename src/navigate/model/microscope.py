@@ -593,23 +593,29 @@ class Microscope:
         ps = float(waveform_constants["other_constants"].get("percent_smoothing", 0.0))
 
         readout_time = 0
-        readout_mode = self.configuration["experiment"]["CameraParameters"][
+        camera_parameters = self.configuration["experiment"]["CameraParameters"][
             self.microscope_name
-        ]["sensor_mode"]
+        ]
+        readout_mode = camera_parameters["sensor_mode"]
 
         if readout_mode == "Normal":
             readout_time = self.camera.calculate_readout_time()
-        elif self.configuration["experiment"]["CameraParameters"][self.microscope_name][
-            "readout_direction"
-        ] in ["Bidirectional", "Rev. Bidirectional"]:
+        elif camera_parameters["readout_direction"] in [
+            "Bidirectional",
+            "Rev. Bidirectional",
+        ]:
             remote_focus_ramp_falling = 0
         # set readout out time
-        self.configuration["experiment"]["CameraParameters"][self.microscope_name][
-            "readout_time"
-        ] = (readout_time * 1000)
+        camera_parameters["readout_time"] = readout_time * 1000
 
-        for channel_key in microscope_state["channels"].keys():
-            channel = microscope_state["channels"][channel_key]
+        # the settle time is the same for every channel
+        settle_duration = max(
+            remote_focus_ramp_falling + duty_cycle_wait_duration,
+            camera_settle_duration,
+            camera_delay,
+        )
+
+        for channel_key, channel in microscope_state["channels"].items():
             if channel["is_selected"] is True:
                 exposure_time = float(channel["camera_exposure_time"]) / 1000
 
@@ -620,11 +626,7 @@ class Microscope:
                         updated_exposure_time,
                     ) = self.camera.calculate_light_sheet_exposure_time(
                         exposure_time,
-                        int(
-                            self.configuration["experiment"]["CameraParameters"][
-                                self.microscope_name
-                            ]["number_of_pixels"]
-                        ),
+                        int(camera_parameters["number_of_pixels"]),
                     )
                     if updated_exposure_time != exposure_time:
                         print(
@@ -648,11 +650,7 @@ class Microscope:
                     exposure_time
                     + readout_time
                     + camera_delay
-                    + max(
-                        remote_focus_ramp_falling + duty_cycle_wait_duration,
-                        camera_settle_duration,
-                        camera_delay,
-                    )
+                    + settle_duration
                     - camera_delay
                 )
                 # TODO: should we keep the percent_smoothing?
@@ -32,6 +32,7 @@
 
 # Standard Library Imports
 import logging
+from functools import lru_cache
 
 # Third Party Imports
 import numpy as np
@@ -88,7 +89,7 @@ def camera_exposure(
 
     # modify the array
     array[pulse_delay_samples : (pulse_samples + pulse_delay_samples)] = amplitude
-    return np.array(array)
+    return array
 
 
 def single_pulse(
@@ -126,7 +127,7 @@ def single_pulse(
     samples = int(np.floor(np.multiply(sample_rate, sweep_time)))
 
     # create an array just containing the offset voltage:
-    array = np.zeros((samples)) + offset
+    array = np.full(samples, offset, dtype=float)
 
     # convert pulse width and delay in % into number of samples
     pulsedelay_samples = int(samples * delay / 100)
@@ -134,7 +135,7 @@ def single_pulse(
 
     # modify the array
     array[pulsedelay_samples : pulsesamples + pulsedelay_samples] = amplitude
-    return np.array(array)
+    return array
 
 
 def remote_focus_ramp(
@@ -185,30 +186,36 @@ def remote_focus_ramp(
         camera_delay, fall, amplitude, offset)
 
     """
-    # create an array just containing the negative amplitude voltage:
+    # number of samples spent at the negative amplitude voltage before the ramp
     delay_samples = int(remote_focus_delay * sample_rate)
-    delay_array = np.zeros(delay_samples) + offset - amplitude
 
     # 10-7.5 -> 1.025 * .2
     #
     ramp_samples = int(
         (exposure_time + camera_delay - remote_focus_delay) * sample_rate
     )
-    ramp_array = np.linspace(offset - amplitude, offset + amplitude, ramp_samples)
 
     # fall_samples = .025 * .2 * 100000 = 500
     fall_samples = int(fall * sample_rate)
-    fall_array = np.linspace(offset + amplitude, offset - amplitude, fall_samples)
 
     extra_samples = int(
         int(np.multiply(sample_rate, sweep_time))
         - (delay_samples + ramp_samples + fall_samples)
     )
-    if extra_samples > 0:
-        extra_array = np.zeros(extra_samples) + offset - amplitude
-        waveform = np.hstack([delay_array, ramp_array, fall_array, extra_array])
-    else:
-        waveform = np.hstack([delay_array, ramp_array, fall_array])
+
+    # fill a single output array segment by segment, rather than building each
+    # segment separately and stacking them.
+    ramp_end = delay_samples + ramp_samples
+    fall_end = ramp_end + fall_samples
+    waveform = np.empty(fall_end + max(extra_samples, 0))
+    waveform[:delay_samples] = offset - amplitude
+    waveform[delay_samples:ramp_end] = np.linspace(
+        offset - amplitude, offset + amplitude, ramp_samples
+    )
+    waveform[ramp_end:fall_end] = np.linspace(
+        offset + amplitude, offset - amplitude, fall_samples
+    )
+    waveform[fall_end:] = offset - amplitude
 
     return waveform
 
@@ -260,45 +267,38 @@ def remote_focus_ramp_triangular(
         camera_delay, fall, amplitude, offset)
 
     """
-    # create an array just containing the negative amplitude voltage:
     # In theory, delay here should be 4H.
     delay_samples = int(remote_focus_delay * sample_rate)
-    delay_array = np.zeros(delay_samples) + offset
 
     # ramp samples
     ramp_samples = int(
         (exposure_time + camera_delay - remote_focus_delay) * sample_rate
     )
-    rise_ramp_array = np.linspace(offset - amplitude, offset + amplitude, ramp_samples)
-    fall_ramp_array = np.linspace(offset + amplitude, offset - amplitude, ramp_samples)
 
     settle_samples = int(
         int(np.multiply(sample_rate, sweep_time)) - (delay_samples + ramp_samples)
     )
-    settle_array = np.zeros(settle_samples) + offset
+    if settle_samples < 0:
+        raise ValueError("negative dimensions are not allowed")
 
     if ramp_type == "Rising":
-        waveform = np.hstack(
-            [
-                delay_array - amplitude,
-                rise_ramp_array,
-                settle_array + amplitude,
-                delay_array + amplitude,
-                fall_ramp_array,
-                settle_array - amplitude,
-            ]
-        )
+        start, end = offset - amplitude, offset + amplitude
     elif ramp_type == "Falling":
-        waveform = np.hstack(
-            [
-                delay_array + amplitude,
-                fall_ramp_array,
-                settle_array - amplitude,
-                delay_array - amplitude,
-                rise_ramp_array,
-                settle_array + amplitude,
-            ]
-        )
+        start, end = offset + amplitude, offset - amplitude
+    else:
+        raise ValueError(f"Unknown remote focus ramp type: {ramp_type}")
+
+    # Each half holds the delay, ramp and settle segments. The second half
+    # ramps back from where the first half ended. Both are written into a
+    # single output array.
+    ramp_end = delay_samples + ramp_samples
+    half_samples = ramp_end + settle_samples
+    waveform = np.empty(2 * half_samples)
+    for half, (low, high) in enumerate(((start, end), (end, start))):
+        segment = waveform[half * half_samples : (half + 1) * half_samples]
+        segment[:delay_samples] = low
+        segment[delay_samples:ramp_end] = np.linspace(low, high, ramp_samples)
+        segment[ramp_end:] = high
 
     return waveform
 
@@ -345,8 +345,11 @@ def sawtooth(
     samples = int(np.multiply(sample_rate, sweep_time))
     duty_cycle = duty_cycle / 100
     t = np.linspace(0, sweep_time, samples)
-    waveform = signal.sawtooth(2 * np.pi * frequency * (t - phase), width=duty_cycle)
-    waveform = amplitude * waveform + offset
+    t -= phase
+    t *= 2 * np.pi * frequency
+    waveform = signal.sawtooth(t, width=duty_cycle)
+    waveform *= amplitude
+    waveform += offset
 
     return waveform
 
@@ -375,9 +378,7 @@ def dc_value(sample_rate=100000, sweep_time=0.4, amplitude=1):
 
     """
     samples = np.multiply(float(sample_rate), sweep_time)
-    waveform = np.zeros(int(samples))
-    waveform[:] = amplitude
-    return waveform
+    return np.full(int(samples), amplitude, dtype=float)
 
 
 def square(
@@ -420,8 +421,11 @@ def square(
     samples = int(sample_rate * sweep_time)
     duty_cycle = duty_cycle / 100
     t = np.linspace(0, sweep_time, samples)
-    waveform = signal.square(2 * np.pi * frequency * t + phase, duty=duty_cycle)
-    waveform = amplitude * waveform + offset
+    t *= 2 * np.pi * frequency
+    t += phase
+    waveform = signal.square(t, duty=duty_cycle)
+    waveform *= amplitude
+    waveform += offset
     return waveform
 
 
@@ -457,11 +461,34 @@ def sine_wave(
 
     """
     samples = int(sample_rate * sweep_time)
-    t = np.linspace(0, sweep_time, samples)
-    waveform = amplitude * np.sin((2 * np.pi * frequency * t) - phase) + offset
+    waveform = np.linspace(0, sweep_time, samples)
+    waveform *= 2 * np.pi * frequency
+    waveform -= phase
+    np.sin(waveform, out=waveform)
+    waveform *= amplitude
+    waveform += offset
     return waveform
 
 
+@lru_cache(maxsize=8)
+def _smoothing_window(window_length):
+    """Return a read-only boxcar window of ones, shared between calls.
+
+    Parameters
+    ----------
+    window_length : int
+        Number of samples in the window.
+
+    Returns
+    -------
+    window : np.array
+        Read-only array of ones.
+    """
+    window = np.ones(window_length)
+    window.flags.writeable = False
+    return window
+
+
 def smooth_waveform(waveform, percent_smoothing=10):
     """Smooths a numpy array via convolution
 
@@ -483,8 +510,9 @@ def smooth_waveform(waveform, percent_smoothing=10):
         # cannot smooth
         return waveform
     waveform_padded = np.pad(waveform, window_length, mode="edge")
-    smoothed_waveform = (
-        np.convolve(waveform_padded, np.ones(window_length), "valid") / window_length
+    smoothed_waveform = np.convolve(
+        waveform_padded, _smoothing_window(window_length), "valid"
     )
+    smoothed_waveform /= window_length
 
     return smoothed_waveform
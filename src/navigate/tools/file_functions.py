@@ -34,6 +34,8 @@
 from datetime import datetime
 import os
 import json
+import shutil
+import tempfile
 import yaml
 from pathlib import Path
 import psutil
@@ -44,6 +46,27 @@ from typing import Union
 # Local application imports
 from navigate.tools.common_functions import copy_proxy_object
 
+#: yaml.Loader: libyaml-backed loader when PyYAML was built with it.
+YAML_LOADER = getattr(yaml, "CFullLoader", yaml.FullLoader)
+
+
+def _get_new_file_mode() -> int:
+    """Get the permissions open() gives a new file under the current umask.
+
+    Returns
+    -------
+    int
+        File mode bits, 0o666 with the umask bits cleared.
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+#: int: Mode of newly created files. The umask is read once, as setting it is
+#: process-wide and would race with files created by other threads.
+_NEW_FILE_MODE = _get_new_file_mode()
+
 
 def get_ram_info() -> tuple:
     """Get computer RAM information.
@@ -152,11 +175,17 @@ def load_yaml_file(file_path: str) -> Union[dict, None]:
     if not file_path.exists():
         return None
     with open(file_path) as f:
-        try:
-            config_data = yaml.load(f, Loader=yaml.FullLoader)
-        except yaml.YAMLError as yaml_error:
-            print(f"Can't load yaml file: {file_path} - {yaml_error}")
-            return None
+        content = f.read()
+    try:
+        # files written by save_yaml_file are JSON, which parses far faster
+        return json.loads(content)
+    except ValueError:
+        pass
+    try:
+        config_data = yaml.load(content, Loader=YAML_LOADER)
+    except yaml.YAMLError as yaml_error:
+        print(f"Can't load yaml file: {file_path} - {yaml_error}")
+        return None
     return config_data
 
 
@@ -182,18 +211,38 @@ def save_yaml_file(
     if file_directory != "" and not os.path.exists(file_directory):
         return False
 
+    file_name = os.path.join(file_directory, filename)
+    temp_file_name = None
     try:
-        file_name = os.path.join(file_directory, filename)
+        file_content = json.dumps(copy_proxy_object(content_dict), indent=4)
+        # nothing to do if the file on disk already holds the same content
         if os.path.exists(file_name):
             with open(file_name, "r") as f:
-                file_content = f.read()
+                if f.read() == file_content:
+                    return True
+        # write to a temporary file and swap it in, so an interrupted write
+        # never leaves a truncated file behind. Each call gets its own
+        # temporary file, so concurrent saves of the same file don't collide.
+        fd, temp_file_name = tempfile.mkstemp(
+            suffix=".tmp",
+            prefix=os.path.basename(file_name) + ".",
+            dir=os.path.dirname(file_name) or os.curdir,
+        )
+        with os.fdopen(fd, "w") as f:
+            f.write(file_content)
+        # mkstemp creates owner-only files, so give the file the mode of the
+        # file it replaces, or of a file newly created with open()
+        if os.path.exists(file_name):
+            shutil.copymode(file_name, temp_file_name)
         else:
-            file_content = ""
-        with open(file_name, "w") as f:
-            f.write(json.dumps(copy_proxy_object(content_dict), indent=4))
+            os.chmod(temp_file_name, _NEW_FILE_MODE)
+        os.replace(temp_file_name, file_name)
     except BaseException:
-        with open(file_name, "w") as f:
-            f.write(file_content)
+        if temp_file_name is not None and os.path.exists(temp_file_name):
+            os.remove(temp_file_name)
+        # the target keeps its previous content, which is empty if it didn't exist
+        if not os.path.exists(file_name):
+            open(file_name, "w").close()
         return False
     return True
 
@@ -34,6 +34,7 @@
 import tkinter as tk
 from tkinter import ttk
 from decimal import Decimal, InvalidOperation
+from bisect import bisect_left
 import logging
 
 # Third party imports
@@ -105,6 +106,16 @@ class ValidatedMixin:
     in the widget.
     """
 
+    #: tuple: Substitution codes passed to the validation callbacks, in the order
+    #: of their (proposed, current, char, event, index, action) arguments.
+    SUBSTITUTION_CODES = ("%P", "%s", "%S", "%V", "%i", "%d")
+
+    #: bool: Whether a focusout validation is waiting for Tk to become idle.
+    _focusout_validation_scheduled = False
+
+    #: bool: Whether the widget is currently showing the error foreground.
+    _error_on = False
+
     # error_var
     def __init__(self, *args, error_var=None, **kwargs):
         """Initialize the ValidatedMixin
@@ -140,17 +151,9 @@ class ValidatedMixin:
         # Includes all validation events keystroke and focus
         self.config(
             validate="all",
-            validatecommand=(
-                validcmd,
-                "%P",
-                "%s",
-                "%S",
-                "%V",
-                "%i",
-                "%d",
-            ),
             # pass in all sub codes/data
-            invalidcommand=(invalidcmd, "%P", "%s", "%S", "%V", "%i", "%d"),
+            validatecommand=(validcmd, *self.SUBSTITUTION_CODES),
+            invalidcommand=(invalidcmd, *self.SUBSTITUTION_CODES),
         )
         #: Hover: The hover bubble for the widget
         self.hover = Hover(self, text=None, type="free")
@@ -168,7 +171,10 @@ class ValidatedMixin:
             Whether to turn the error message on or off
 
         """
-        self.config(foreground=("red" if on else "black"))
+        # Only reconfigure the widget when the error state actually changes
+        if on != self._error_on:
+            self.config(foreground=("red" if on else "black"))
+            self._error_on = on
 
     def _validate(self, proposed, current, char, event, index, action):
         """Validate the input of the widget
@@ -313,6 +319,21 @@ class ValidatedMixin:
             self._focusout_invalid(event="focusout")
         return valid
 
+    def schedule_focusout_validation(self):
+        """Trigger the focusout validation of the widget once Tk is idle.
+
+        Several requests made before Tk becomes idle, e.g. a burst of range
+        updates, are handled by a single validation.
+        """
+        if not self._focusout_validation_scheduled:
+            self._focusout_validation_scheduled = True
+            self.after_idle(self._run_scheduled_focusout_validation)
+
+    def _run_scheduled_focusout_validation(self):
+        """Run the focusout validation requested by schedule_focusout_validation."""
+        self._focusout_validation_scheduled = False
+        self.trigger_focusout_validation()
+
     def add_history(self, event):
         """Add the current value to the history of the widget.
 
@@ -555,7 +576,7 @@ class ValidatedEntry(ValidatedMixin, ttk.Entry):
             self.is_fake_focusout = False
             return False
         proposed_precision = proposed.as_tuple().exponent
-        if any([(proposed > max_val), (proposed_precision < self.precision)]):
+        if proposed > max_val or proposed_precision < self.precision:
             return False
 
         if proposed < min_val:
@@ -653,7 +674,7 @@ class ValidatedEntry(ValidatedMixin, ttk.Entry):
             self.delete(0, tk.END)
         else:
             self.variable.set(current)
-        self.trigger_focusout_validation()  # Revalidate with the new minimum
+        self.schedule_focusout_validation()  # Revalidate with the new minimum
 
     def _set_maximum(self, *args):
         """Set the maximum value of the entry when focus is lost.
@@ -673,7 +694,7 @@ class ValidatedEntry(ValidatedMixin, ttk.Entry):
             self.delete(0, tk.END)
         else:
             self.variable.set(current)
-        self.trigger_focusout_validation()  # Revalidate with the new maximum
+        self.schedule_focusout_validation()  # Revalidate with the new maximum
 
     def _toggle_error(self, on=False):
         """Toggle the error state of the entry.
@@ -830,6 +851,42 @@ class ValidatedCombobox(ValidatedMixin, ttk.Combobox):
         Keyword arguments to pass to the combobox
     """
 
+    #: tuple: Lower-cased combobox values in sorted order and the values they
+    #: belong to, rebuilt after the values are configured.
+    _sorted_values = None
+
+    def configure(self, cnf=None, **kw):
+        """Configure the combobox, dropping the cached values if they change.
+
+        Parameters
+        ----------
+        cnf : dict, optional
+            Options to configure
+        **kw
+            Options to configure
+        """
+        if "values" in kw or (isinstance(cnf, dict) and "values" in cnf):
+            self._sorted_values = None
+        return super().configure(cnf, **kw)
+
+    config = configure
+
+    def _get_sorted_values(self):
+        """Get the lower-cased combobox values in sorted order.
+
+        Returns
+        -------
+        tuple
+            The sorted lower-cased values and the matching combobox values.
+        """
+        if self._sorted_values is None:
+            pairs = sorted((x.lower(), x) for x in self.cget("values"))
+            self._sorted_values = (
+                tuple(pair[0] for pair in pairs),
+                tuple(pair[1] for pair in pairs),
+            )
+        return self._sorted_values
+
     def _key_validate(self, proposed, action, **kwargs):
         """Validate the input of the combobox when a key is pressed.
 
@@ -855,10 +912,17 @@ class ValidatedCombobox(ValidatedMixin, ttk.Combobox):
             return True
 
         # Get list of combo values
-        values = self.cget("values")
-
-        # Check for words typed in if they match then set to that value
-        matching = [x for x in values if x.lower().startswith(proposed.lower())]
+        lower_values, values = self._get_sorted_values()
+
+        # Check for words typed in if they match then set to that value. Values
+        # sharing the prefix are adjacent once sorted, so only the first two matter.
+        proposed = proposed.lower()
+        index = bisect_left(lower_values, proposed)
+        matching = [
+            values[i]
+            for i in range(index, min(index + 2, len(values)))
+            if lower_values[i].startswith(proposed)
+        ]
         if len(matching) == 0:
             valid = False
         elif len(matching) == 1:
@@ -899,6 +963,10 @@ class ValidatedSpinbox(ValidatedMixin, ttk.Spinbox):
     widgets)
     """
 
+    #: tuple: The spinbox (from, to) range as Decimals, rebuilt after it is
+    #: configured.
+    _range = None
+
     def __init__(
         self,
         *args,
@@ -967,6 +1035,40 @@ class ValidatedSpinbox(ValidatedMixin, ttk.Spinbox):
 
         self.bind("<FocusOut>", self._set_focus_update_var)
 
+    def configure(self, cnf=None, **kw):
+        """Configure the spinbox, dropping the cached range if it changes.
+
+        Parameters
+        ----------
+        cnf : dict, optional
+            Options to configure
+        **kw
+            Options to configure
+        """
+        options = set(kw)
+        if isinstance(cnf, dict):
+            options.update(cnf)
+        if options & {"from_", "from", "to"}:
+            self._range = None
+        return super().configure(cnf, **kw)
+
+    config = configure
+
+    def _get_range(self):
+        """Get the minimum and maximum values of the spinbox.
+
+        Returns
+        -------
+        tuple
+            The (from, to) values of the spinbox as Decimals.
+        """
+        if self._range is None:
+            self._range = (
+                Decimal(str(self.cget("from"))),
+                Decimal(str(self.cget("to"))),
+            )
+        return self._range
+
     def set_precision(self, prec):
         """Set the precision of the spinbox in decimal places.
 
@@ -1044,8 +1146,7 @@ class ValidatedSpinbox(ValidatedMixin, ttk.Spinbox):
         bool
             True if the proposed is valid, False if not
         """
-        min_val = self.cget("from")
-        max_val = self.cget("to")
+        min_val, max_val = self._get_range()
 
         if proposed == "-" or proposed == ".":
             self._toggle_error(True)
@@ -1058,7 +1159,7 @@ class ValidatedSpinbox(ValidatedMixin, ttk.Spinbox):
             return False
         proposed_precision = proposed.as_tuple().exponent
 
-        if any([(proposed > max_val), (proposed_precision < self.precision)]):
+        if proposed > max_val or proposed_precision < self.precision:
             return False
 
         if proposed < min_val:
@@ -1160,7 +1261,7 @@ class ValidatedSpinbox(ValidatedMixin, ttk.Spinbox):
             self.delete(0, tk.END)
         else:
             self.variable.set(current)
-        self.trigger_focusout_validation()  # Revalidate with the new minimum
+        self.schedule_focusout_validation()  # Revalidate with the new minimum
 
     def _set_maximum(self, *args):
         """Set the maximum value of the spinbox when focus is lost.
@@ -1184,7 +1285,7 @@ class ValidatedSpinbox(ValidatedMixin, ttk.Spinbox):
             self.delete(0, tk.END)
         else:
             self.variable.set(current)
-        self.trigger_focusout_validation()  # Revalidate with the new maximum
+        self.schedule_focusout_validation()  # Revalidate with the new maximum
 
     def _toggle_error(self, on=False):
         """Toggle the error message of the spinbox.
@@ -1214,8 +1315,7 @@ class ValidatedSpinbox(ValidatedMixin, ttk.Spinbox):
         """
         value = self.get()
         if value != "":
-            min_val = self.cget("from")
-            max_val = self.cget("to")
+            min_val, max_val = self._get_range()
             # Don't add duplicates
             if self.undo_history and self.undo_history[-1] == value:
                 pass
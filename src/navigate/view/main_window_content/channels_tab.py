@@ -579,99 +579,75 @@ class StackTimePointFrame(ttk.Labelframe):
         self.save_check.grid(row=0, column=1, sticky=tk.NSEW, pady=(4, 0))
         self.inputs["save_check"] = self.save_check
 
-        # Timepoints Label, spinbox defaults to 1.
-        #: tkinter.Label: The label for the timepoints spinbox
-        self.filterwheel_label = ttk.Label(self, text="Timepoints")
-        self.filterwheel_label.grid(
-            row=1, column=0, sticky=tk.NSEW, padx=(4, 5), pady=2
-        )
-        #: tk.StringVar: The variable for the timepoints spinbox
-        self.exp_time_spinval = tk.StringVar()
-
-        #: ttk.Spinbox: The timepoints spinbox
-        self.exp_time_spinbox = ValidatedSpinbox(
-            self,
-            textvariable=self.exp_time_spinval,
-            width=3,
-        )
-        self.exp_time_spinbox.grid(row=1, column=1, sticky=tk.NSEW, pady=2)
-        self.inputs["time_spin"] = self.exp_time_spinbox
-
-        # Stack Acq. Time Label
-        #: tkinter.Label: The label for the stack acquisition time spinbox
-        self.exp_time_label = ttk.Label(self, text="Stack Acq. Time")
-        self.exp_time_label.grid(row=2, column=0, sticky=tk.NSEW, padx=(4, 5), pady=2)
-
-        # Stack Acq. Time Spinbox
-        #: tk.StringVar: The variable for the stack acquisition time spinbox
-        self.stack_acq_spinval = tk.StringVar()
-
-        #: ttk.Spinbox: The stack acquisition time spinbox
-        self.stack_acq_spinbox = ttk.Spinbox(
-            self,
-            textvariable=self.stack_acq_spinval,  # this holds the data in the entry
-            width=6,
-        )
-        self.stack_acq_spinbox.grid(row=2, column=1, sticky=tk.NSEW, pady=2)
-        self.stack_acq_spinbox.state(["disabled"])  # Starts it disabled
-
-        # Stack Pause Label
-        #: tkinter.Label: The label for the stack pause spinbox
-        self.exp_time_label = ttk.Label(self, text="Stack Pause (s)")
-        self.exp_time_label.grid(row=0, column=2, sticky=tk.NSEW, padx=(4, 5), pady=2)
-
-        # Stack Pause Spinbox
-        #: tk.StringVar: The variable for the stack pause spinbox
-        self.stack_pause_spinval = tk.StringVar()
-
-        #: ttk.Spinbox: The stack pause spinbox
-        self.stack_pause_spinbox = ValidatedSpinbox(
-            self,
-            textvariable=self.stack_pause_spinval,
-            width=6,
-        )
-        self.stack_pause_spinbox.grid(row=0, column=3, sticky=tk.NSEW, pady=2)
-        self.inputs["stack_pause"] = self.stack_pause_spinbox
-
-        # Timepoint Interval Label
-        #: tkinter.Label: The label for the timepoint interval spinbox
-        self.exp_time_label = ttk.Label(self, text="Time Interval (hh:mm:ss)")
-        self.exp_time_label.grid(row=1, column=2, sticky=tk.NSEW, padx=(4, 5), pady=2)
-
-        # Timepoint Interval Spinbox
-        #: tk.StringVar: The variable for the timepoint interval spinbox
-        self.timepoint_interval_spinval = tk.StringVar()
-        if self.timepoint_interval_spinval.get() == "":
-            self.timepoint_interval_spinval.set("0")
-        #: ttk.Spinbox: The timepoint interval spinbox
-        self.timepoint_interval_spinbox = ttk.Spinbox(
-            self,
-            textvariable=self.timepoint_interval_spinval,
-            width=6,
-        )
-        self.timepoint_interval_spinbox.grid(row=1, column=3, sticky=tk.NSEW, pady=2)
-        self.timepoint_interval_spinbox.state(["disabled"])  # Starts it disabled
-
-        # Total Time Label
-        #: tkinter.Label: The label for the total time spinbox
-        self.exp_time_label = ttk.Label(self, text="Experiment Duration (hh:mm:ss)")
-        self.exp_time_label.grid(
-            row=2, column=2, sticky=tk.NSEW, padx=(4, 5), pady=(2, 6)
+        # Timepoint spinboxes. Each spec creates <name>_label, <name>_spinval and
+        # <name>_spinbox. Specs without an inputs key hold calculated values.
+        spinbox_specs = (
+            {
+                "name": "exp_time",
+                "text": "Timepoints",
+                "row": 1,
+                "column": 0,
+                "widget": ValidatedSpinbox,
+                "width": 3,
+                "input_key": "time_spin",
+            },
+            {
+                "name": "stack_acq",
+                "text": "Stack Acq. Time",
+                "row": 2,
+                "column": 0,
+                "widget": ttk.Spinbox,
+            },
+            {
+                "name": "stack_pause",
+                "text": "Stack Pause (s)",
+                "row": 0,
+                "column": 2,
+                "widget": ValidatedSpinbox,
+                "input_key": "stack_pause",
+            },
+            {
+                "name": "timepoint_interval",
+                "text": "Time Interval (hh:mm:ss)",
+                "row": 1,
+                "column": 2,
+                "widget": ttk.Spinbox,
+                "default": "0",
+            },
+            {
+                "name": "total_time",
+                "text": "Experiment Duration (hh:mm:ss)",
+                "row": 2,
+                "column": 2,
+                "widget": ttk.Spinbox,
+                "default": "0",
+                "pady": (2, 6),
+            },
         )
 
-        # Total Time Spinbox
-        #: tk.StringVar: The variable for the total time spinbox
-        self.total_time_spinval = tk.StringVar()
-        if self.total_time_spinval.get() == "":
-            self.total_time_spinval.set("0")
-        #: ttk.Spinbox: The total time spinbox
-        self.total_time_spinval = ttk.Spinbox(
-            self,
-            textvariable=self.total_time_spinval,
-            width=6,
-        )
-        self.total_time_spinval.grid(row=2, column=3, sticky=tk.NSEW, pady=(2, 6))
-        self.total_time_spinval.state(["disabled"])
+        for spec in spinbox_specs:
+            row, column = spec["row"], spec["column"]
+            pady = spec.get("pady", 2)
+
+            label = ttk.Label(self, text=spec["text"])
+            label.grid(row=row, column=column, sticky=tk.NSEW, padx=(4, 5), pady=pady)
+
+            variable = tk.StringVar(value=spec.get("default", ""))
+            spinbox = spec["widget"](
+                self, textvariable=variable, width=spec.get("width", 6)
+            )
+            spinbox.grid(row=row, column=column + 1, sticky=tk.NSEW, pady=pady)
+
+            setattr(self, f"{spec['name']}_label", label)
+            setattr(self, f"{spec['name']}_spinval", variable)
+            setattr(self, f"{spec['name']}_spinbox", spinbox)
+
+            input_key = spec.get("input_key")
+            if input_key is None:
+                # Calculated values are display only.
+                spinbox.state(["disabled"])
+            else:
+                self.inputs[input_key] = spinbox
 
     # Getters
     def get_variables(self):
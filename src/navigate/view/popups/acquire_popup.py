@@ -100,85 +100,67 @@ class AcquirePopUp:
         self.entries_label.grid(row=0, column=0, columnspan=2, sticky=tk.NSEW, pady=5)
 
         # Creating Entry Widgets
-        entry_names = [
-            "root_directory",
-            "user",
-            "tissue",
-            "celltype",
-            "label",
-            "prefix",
-            "solvent",
-            "file_type",
-            "misc",
+        # (name, label, left padding of the input widget, if any)
+        entries = [
+            ("root_directory", "Root Directory", None),
+            ("user", "User", 53),
+            ("tissue", "Tissue Type", 16),
+            ("celltype", "Cell Type", 28),
+            ("label", "Label", 48),
+            ("prefix", "Prefix", 46),
+            ("solvent", "Solvent", None),
+            ("file_type", "File Type", None),
+            ("misc", "Notes", 40),
         ]
-
-        entry_labels = [
-            "Root Directory",
-            "User",
-            "Tissue Type",
-            "Cell Type",
-            "Label",
-            "Prefix",
-            "Solvent",
-            "File Type",
-            "Notes",
-        ]
-        max_length = max([len(s) for s in entry_labels])
         # TODO: Make labels have equal spacing.
 
         # Loop for each entry and label
-        for i in range(len(entry_names)):
-            if entry_names[i] == "misc":
-                self.inputs[entry_names[i]] = LabelInput(
+        for i, (entry_name, entry_label, padx) in enumerate(entries):
+            if entry_name == "misc":
+                self.inputs[entry_name] = LabelInput(
                     parent=content_frame,
-                    label=entry_labels[i],
+                    label=entry_label,
                     input_class=ScrolledText,
                     input_args={"wrap": tk.WORD, "width": 40, "height": 10},
                 )
-            elif entry_names[i] == "file_type":
-                self.inputs[entry_names[i]] = LabelInput(
+            elif entry_name == "file_type":
+                self.inputs[entry_name] = LabelInput(
                     parent=content_frame,
-                    label=entry_labels[i],
+                    label=entry_label,
                     input_class=ValidatedCombobox,
                     input_var=tk.StringVar(),
                     label_args={"padding": [0, 0, 30, 0]}
                 )
-                self.inputs[entry_names[i]].set_values(tuple(FILE_TYPES))
-                self.inputs[entry_names[i]].set("TIFF")
+                self.inputs[entry_name].set_values(tuple(FILE_TYPES))
+                self.inputs[entry_name].set("TIFF")
 
-            elif entry_names[i] == "solvent":
-                self.inputs[entry_names[i]] = LabelInput(
+            elif entry_name == "solvent":
+                self.inputs[entry_name] = LabelInput(
                     parent=content_frame,
-                    label=entry_labels[i],
+                    label=entry_label,
                     input_class=ValidatedCombobox,
                     input_var=tk.StringVar(),
                     label_args={"padding": [0, 0, 36, 0]}
                 )
-                self.inputs[entry_names[i]].set_values(
+                self.inputs[entry_name].set_values(
                     ("BABB", "Water", "CUBIC", "CLARITY", "uDISCO", "eFLASH")
                 )
-                self.inputs[entry_names[i]].set("BABB")
+                self.inputs[entry_name].set("BABB")
 
             else:
-                self.inputs[entry_names[i]] = LabelInput(
+                self.inputs[entry_name] = LabelInput(
                     parent=content_frame,
-                    label=entry_labels[i],
+                    label=entry_label,
                     input_class=ttk.Entry,
                     input_var=tk.StringVar(),
                     input_args={"width": 50},
                 )
-            self.inputs[entry_names[i]].grid(
+            self.inputs[entry_name].grid(
                 row=i + 1, column=0, columnspan=2, sticky=tk.NSEW, padx=5
             )
-            self.inputs[entry_names[i]].label.grid(padx=(0, 20))
-
-        # Formatting
-        self.inputs["user"].widget.grid(padx=(53, 0))
-        self.inputs["tissue"].widget.grid(padx=(16, 0))
-        self.inputs["celltype"].widget.grid(padx=(28, 0))
-        self.inputs["prefix"].widget.grid(padx=(46, 0))
-        self.inputs["label"].widget.grid(padx=(48, 0))
-        self.inputs["misc"].widget.grid(padx=(40, 0))
+            self.inputs[entry_name].label.grid(padx=(0, 20))
+            if padx is not None:
+                self.inputs[entry_name].widget.grid(padx=(padx, 0))
 
         # Done and Cancel Buttons
         self.buttons["Cancel"] = ttk.Button(content_frame, text="Cancel Acquisition")
@@ -68,6 +68,7 @@ def test_config_methods():
         "get_configuration_paths",
         "get_navigate_path",
         "isfile",
+        "json",
         "load_configs",
         "os",
         "platform",
@@ -79,6 +80,7 @@ def test_config_methods():
         "verify_waveform_constants",
         "verify_configuration",
         "yaml",
+        "YAML_LOADER",
         "logging",
         "logger",
         "p",
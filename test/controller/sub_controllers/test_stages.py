@@ -382,3 +382,66 @@ def test_position_callback(stage_controller):
         callback()
         stage_controller.view.after.assert_called_once()
         stage_controller.view.after.reset_mock()
+
+
+def test_position_callback_debounce(stage_controller, monkeypatch):
+    from navigate.controller.sub_controllers import stages
+
+    now = [100.0]
+    monkeypatch.setattr(stages.time, "monotonic", lambda: now[0])
+    after = MagicMock(return_value="after_id")
+    monkeypatch.setattr(stage_controller.view, "after", after)
+    monkeypatch.setattr(stage_controller.view, "after_cancel", MagicMock())
+    monkeypatch.setattr(stage_controller.view, "focus_get", lambda: True)
+    execute = MagicMock()
+    monkeypatch.setattr(stage_controller.parent_controller, "execute", execute)
+    monkeypatch.setattr(stage_controller, "show_verbose_info", MagicMock())
+    monkeypatch.setattr(stage_controller, "position_min", pos_dict(0))
+    monkeypatch.setattr(stage_controller, "position_max", pos_dict(10))
+    monkeypatch.setattr(stage_controller, "stage_setting_dict", {})
+    monkeypatch.setattr(stage_controller, "pending_positions", {})
+    monkeypatch.setattr(stage_controller, "event_id", None)
+    monkeypatch.setattr(stage_controller, "last_move_time", 0.0)
+
+    position = MagicMock()
+    monkeypatch.setattr(stage_controller.widget_vals["x"], "get", position)
+    widget = stage_controller.view.get_widgets()["x"].widget
+    monkeypatch.setattr(widget, "trigger_focusout_validation", MagicMock())
+
+    callback = stage_controller.position_callback("x")
+    interval = stage_controller.min_move_interval
+    delay = stage_controller.debounce_delay
+
+    # Leading move: the stage has not moved recently, so it moves right away
+    position.return_value = 1.0
+    callback()
+    execute.assert_called_once_with("stage", {"x": 1.0})
+    after.assert_called_once_with(
+        int(delay * 1000), stage_controller.move_pending_positions
+    )
+
+    # Suppressed move: a change within the interval is only kept pending
+    execute.reset_mock()
+    now[0] += interval / 2
+    position.return_value = 2.0
+    callback()
+    execute.assert_not_called()
+    assert stage_controller.pending_positions == {"x": 2.0}
+
+    # Rate cap: once min_move_interval has passed, input moves the stage again
+    now[0] += interval
+    position.return_value = 3.0
+    callback()
+    execute.assert_called_once_with("stage", {"x": 3.0})
+
+    # Suppressed again within the interval
+    execute.reset_mock()
+    now[0] += interval / 2
+    position.return_value = 4.0
+    callback()
+    execute.assert_not_called()
+
+    # Trailing move: the scheduled callback sends the last position
+    after.call_args[0][1]()
+    execute.assert_called_once_with("stage", {"x": 4.0})
+    assert stage_controller.pending_positions == {}
@@ -1,6 +1,6 @@
 import pytest
 import random
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, call
 
 
 @pytest.fixture(scope="module")
@@ -176,3 +176,31 @@ def test_estimate_galvo_setting_with_string(waveform_popup_controller):
 
     # Check to see what the view was called with.
     waveform_popup_controller.view.inputs[galvo_name].widget.set.assert_called_once()
+
+
+def test_schedule_setting_update(waveform_popup_controller, monkeypatch):
+    """Test that different settings changed within 500 ms are all sent."""
+    after = MagicMock(return_value="after_id")
+    monkeypatch.setattr(waveform_popup_controller.view.popup, "after", after)
+    execute = MagicMock()
+    monkeypatch.setattr(waveform_popup_controller.parent_controller, "execute", execute)
+    monkeypatch.setattr(waveform_popup_controller, "event_id", None)
+    monkeypatch.setattr(waveform_popup_controller, "pending_settings", [])
+
+    waveform_popup_controller.schedule_setting_update("resolution")
+    waveform_popup_controller.schedule_setting_update("galvo")
+    waveform_popup_controller.schedule_setting_update("galvo")
+
+    # One update is scheduled and nothing is sent before it runs
+    after.assert_called_once_with(
+        500, waveform_popup_controller.update_pending_settings
+    )
+    execute.assert_not_called()
+
+    # Run the scheduled update
+    after.call_args[0][1]()
+    assert execute.call_args_list == [
+        call("update_setting", "resolution"),
+        call("update_setting", "galvo"),
+    ]
+    assert waveform_popup_controller.event_id is None
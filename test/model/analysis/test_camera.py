@@ -17,6 +17,26 @@ def test_compute_scmos_offset_and_variance_map():
     np.testing.assert_allclose(variance, sig * sig, rtol=1)
 
 
+def test_compute_scmos_offset_and_variance_map_matches_numpy():
+    from navigate.model.analysis.camera import compute_scmos_offset_and_variance_map
+
+    rng = np.random.default_rng(0)
+
+    # float stacks keep their precision
+    im = rng.normal(100, 3, (50, 64, 64))
+    offset, variance = compute_scmos_offset_and_variance_map(im)
+    np.testing.assert_allclose(offset, np.mean(im, axis=0), rtol=1e-12)
+    np.testing.assert_allclose(variance, np.var(im, axis=0), rtol=1e-12)
+
+    # integer stacks are truncated to the camera dtype, like np.var().astype(),
+    # so float rounding just below an integer can move a pixel down by one
+    im = rng.poisson(100, (200, 64, 64)).astype(np.uint16)
+    offset, variance = compute_scmos_offset_and_variance_map(im)
+    assert variance.dtype == np.uint16
+    np.testing.assert_allclose(offset, np.mean(im, axis=0).astype(np.uint16), atol=1)
+    np.testing.assert_allclose(variance, np.var(im, axis=0).astype(np.uint16), atol=1)
+
+
 @pytest.mark.parametrize("local", [True, False])
 def test_compute_flatfield_map(local):
     from navigate.model.analysis.camera import compute_flatfield_map
@@ -60,12 +60,14 @@ def test_tiff_write_read(is_ome, multiposition, per_stack, z_stack, stop_early):
     )
     file_names_raw = []
     for i in range(n_images):
-        ds.write(data[i, ...].squeeze())
+        ds.write(data[i])
         file_names_raw.extend(ds.file_name)
         if stop_early and np.random.rand() > 0.5:
             break
     ds.close()
 
+    shape_x, shape_y, shape_z = ds.shape_x, ds.shape_y, ds.shape_z
+
     # Cannot use list(set()) trick here because ordering is important
     file_names = []
     for fn in file_names_raw:
@@ -79,15 +81,15 @@ def test_tiff_write_read(is_ome, multiposition, per_stack, z_stack, stop_early):
             ds2 = TiffDataSource(fn, "r")
             # Make sure XYZ size is correct (and C and T are each of size 1)
             assert (
-                (ds2.shape_x == ds.shape_x)
-                and (ds2.shape_y == ds.shape_y)
+                (ds2.shape_x == shape_x)
+                and (ds2.shape_y == shape_y)
                 and (ds2.shape_c == 1)
                 and (ds2.shape_t == 1)
-                and (ds2.shape_z == ds.shape_z)
+                and (ds2.shape_z == shape_z)
             )
             # Make sure the data copied properly
             np.testing.assert_equal(
-                ds2.data, data[i * ds.shape_z : (i + 1) * ds.shape_z, ...].squeeze()
+                ds2.data, data[i * shape_z : (i + 1) * shape_z, ...].squeeze()
             )
             ds2.close()
     except IndexError as e:
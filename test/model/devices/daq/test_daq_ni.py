@@ -76,3 +76,31 @@ def test_daq_ni_functions():
             getattr(daq, f)(*a)
         else:
             getattr(daq, f)()
+
+
+def test_fill_analog_output_buffer():
+    import numpy as np
+    from navigate.model.devices.daq.ni import NIDAQ
+
+    daq = NIDAQ.__new__(NIDAQ)
+    daq.analog_output_buffers = {}
+    daq.waveform_expand_num = 3
+    daq.analog_outputs = {
+        "PXI6259/ao0": {"waveform": {"channel_1": np.arange(4.0)}},
+        "PXI6259/ao1": {"waveform": {"channel_1": np.ones(4)}},
+        "PXI6738/ao0": {"waveform": {"channel_1": np.zeros(4)}},
+    }
+
+    # nidaqmx writes from a writeable, C-contiguous float64 array
+    waveforms = daq.fill_analog_output_buffer("PXI6259", "channel_1", 12, expand=True)
+    assert waveforms.shape == (2, 12)
+    assert waveforms.flags.c_contiguous and waveforms.flags.writeable
+    assert waveforms.dtype == np.float64
+    np.testing.assert_array_equal(waveforms[0], np.tile(np.arange(4.0), 3))
+
+    # a single channel is squeezed to 1D and the buffer is reused
+    buffer = daq.fill_analog_output_buffer("PXI6738", "channel_1", 4)
+    assert buffer.shape == (4,)
+    assert buffer.flags.c_contiguous and buffer.flags.writeable
+    again = daq.fill_analog_output_buffer("PXI6738", "channel_1", 4)
+    assert np.shares_memory(buffer, again)
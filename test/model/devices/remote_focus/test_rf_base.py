@@ -106,3 +106,24 @@ def test_remote_focus_base_adjust(smoothing):
             # The channel doesn't exist. Points to an issue in how waveform dict
             # is created.
             continue
+
+
+def test_remote_focus_base_adjust_no_selected_channels():
+    from navigate.model.devices.remote_focus.base import RemoteFocusBase
+    from test.model.dummy import DummyModel
+
+    model = DummyModel()
+    microscope_name = model.configuration["experiment"]["MicroscopeState"][
+        "microscope_name"
+    ]
+    microscope_state = model.configuration["experiment"]["MicroscopeState"]
+    for channel in microscope_state["channels"].values():
+        channel["is_selected"] = False
+
+    rf = RemoteFocusBase(microscope_name, None, model.configuration)
+
+    # No remote focus constants are needed when no channel is selected
+    microscope_state["zoom"] = "no-such-zoom"
+    waveform_dict = rf.adjust({}, {})
+
+    assert all(v is None for v in waveform_dict.values())
@@ -32,8 +32,10 @@
 # Standard library imports
 import unittest
 import os
+import stat
 from datetime import datetime
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 # Third party imports
 
@@ -189,6 +191,35 @@ class SaveYAMLFileTestCase(unittest.TestCase):
             saved_content = json.load(f)
         self.assertEqual(saved_content, content_dict)
 
+    def test_save_yaml_file_concurrent(self):
+        contents = [{"name": "John Doe", "age": age} for age in range(20)]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(lambda c: save_yaml_file(self.save_root, c), contents)
+            )
+
+        # Assert that every save succeeded and left no temporary file behind
+        self.assertTrue(all(results))
+        self.assertEqual(os.listdir(self.save_root), ["experiment.yml"])
+
+        # Assert that the file holds one of the saved contents in full
+        with open(os.path.join(self.save_root, "experiment.yml"), "r") as f:
+            self.assertIn(json.load(f), contents)
+
+    def test_save_yaml_file_new_file_mode(self):
+        reference_path = os.path.join(self.save_root, "reference.yml")
+        open(reference_path, "w").close()
+
+        save_yaml_file(self.save_root, {"name": "John Doe"})
+
+        # Assert that a new file gets the same permissions as one made by open()
+        file_path = os.path.join(self.save_root, "experiment.yml")
+        self.assertEqual(
+            stat.S_IMODE(os.stat(file_path).st_mode),
+            stat.S_IMODE(os.stat(reference_path).st_mode),
+        )
+
     def test_save_yaml_file_failure(self):
         # Test with non-existing directory
         content_dict = {"name": "John Doe", "age": 30, "location": "New York"}
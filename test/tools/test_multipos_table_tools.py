@@ -31,19 +31,18 @@
 
 # Standard library imports
 import unittest
+from types import SimpleNamespace
 import pytest
-import tkinter as tk
-from tkinter import ttk
 from math import ceil
 
 # Third party imports
 import numpy as np
+import pandas as pd
 
 # Local application imports
 from navigate.tools.multipos_table_tools import (
     update_table,
 )
-from navigate.view.main_window_content.multiposition_tab import MultiPositionTable
 
 
 @pytest.mark.parametrize("pair", zip([5.6, -3.8, 0], [1, -1, 1]))
@@ -55,6 +54,10 @@ def test_sign(pair):
     assert sign(x) == cmp_x
 
 
+# Seeded generator so the parametrized inputs are the same on every run
+RNG = np.random.default_rng(0)
+
+
 def listize(x):
     if type(x) == np.ndarray:
         return list(x)
@@ -62,26 +65,37 @@ def listize(x):
         return [x]
 
 
-@pytest.mark.parametrize("x_start", listize((np.random.rand() - 0.5) * 1000))
-@pytest.mark.parametrize("x_tiles", listize(np.random.randint(0, 5)))
-@pytest.mark.parametrize("x_length", listize(np.random.rand() * 1000))
-@pytest.mark.parametrize("x_overlap", listize(np.random.rand()))
-@pytest.mark.parametrize("y_start", listize(((np.random.rand() - 0.5) * 1000)))
-@pytest.mark.parametrize("y_tiles", listize(np.random.randint(0, 5)))
-@pytest.mark.parametrize("y_length", listize(np.random.rand() * 1000))
-@pytest.mark.parametrize("y_overlap", listize(np.random.rand()))
-@pytest.mark.parametrize("z_start", listize(((np.random.rand() - 0.5) * 1000)))
-@pytest.mark.parametrize("z_tiles", listize(np.random.randint(0, 5)))
-@pytest.mark.parametrize("z_length", listize(np.random.rand() * 1000))
-@pytest.mark.parametrize("z_overlap", listize(np.random.rand()))
-@pytest.mark.parametrize("theta_start", listize(((np.random.rand() - 0.5) * 180)))
-@pytest.mark.parametrize("theta_tiles", listize(np.random.randint(0, 5)))
-@pytest.mark.parametrize("theta_length", listize((np.random.rand() * 5)))
-@pytest.mark.parametrize("theta_overlap", listize(np.random.rand()))
-@pytest.mark.parametrize("f_start", listize(((np.random.rand() - 0.5) * 1000)))
-@pytest.mark.parametrize("f_tiles", listize(np.random.randint(0, 5)))
-@pytest.mark.parametrize("f_length", listize(np.random.rand() * 1000))
-@pytest.mark.parametrize("f_overlap", listize(np.random.rand()))
+def bounding_box_cases(n_cases, rng=RNG):
+    """Generate reproducible random start, tiles, length and overlap values for each
+    axis of compute_tiles_from_bounding_box."""
+    cases = []
+    for _ in range(n_cases):
+        case = []
+        for start_range, length_range in (
+            (1000, 1000),
+            (1000, 1000),
+            (1000, 1000),
+            (180, 5),
+            (1000, 1000),
+        ):
+            case += [
+                (rng.random() - 0.5) * start_range,
+                int(rng.integers(0, 5)),
+                rng.random() * length_range,
+                rng.random(),
+            ]
+        cases.append(tuple(case))
+    return cases
+
+
+@pytest.mark.parametrize(
+    "x_start, x_tiles, x_length, x_overlap, "
+    "y_start, y_tiles, y_length, y_overlap, "
+    "z_start, z_tiles, z_length, z_overlap, "
+    "theta_start, theta_tiles, theta_length, theta_overlap, "
+    "f_start, f_tiles, f_length, f_overlap",
+    bounding_box_cases(5),
+)
 @pytest.mark.parametrize("f_track_with_z", [True, False])
 def test_compute_tiles_from_bounding_box(
     x_start,
@@ -181,9 +195,9 @@ def test_compute_tiles_from_bounding_box(
         assert len(tiles) == x_tiles * y_tiles * z_tiles * theta_tiles * f_tiles
 
 
-@pytest.mark.parametrize("dist", listize(np.random.rand(3) * 1000))
-@pytest.mark.parametrize("overlap", listize(np.random.rand(3)))
-@pytest.mark.parametrize("roi_length", listize(np.random.rand(3) * 1000))
+@pytest.mark.parametrize("dist", listize(RNG.random(3) * 1000))
+@pytest.mark.parametrize("overlap", listize(RNG.random(3)))
+@pytest.mark.parametrize("roi_length", listize(RNG.random(3) * 1000))
 def test_calc_num_tiles(dist, overlap, roi_length):
     from navigate.tools.multipos_table_tools import calc_num_tiles
 
@@ -201,14 +215,26 @@ def test_calc_num_tiles(dist, overlap, roi_length):
     assert result == expected_num_tiles
 
 
+class DummyTable:
+    """Stands in for MultiPositionTable with just what update_table uses."""
+
+    def __init__(self):
+        self.model = SimpleNamespace(df=pd.DataFrame(columns=list("XYZRF")))
+        self.currentrow = 0
+
+    def resetColors(self):
+        pass
+
+    def redraw(self):
+        pass
+
+    def tableChanged(self):
+        pass
+
+
 class UpdateTableTestCase(unittest.TestCase):
     def setUp(self):
-        self.root = tk.Tk()
-        self.frame = ttk.Frame()
-        self.table = MultiPositionTable(parent=self.frame)
-
-    def tearDown(self) -> None:
-        self.root.destroy()
+        self.table = DummyTable()
 
     def test_update_table_1(self):
         pos = np.array([[1, 2, 3, 4, 5], [6, 7, 8, 9, 10], [11, 12, 13, 14, 15]])